@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Shared WebDriver helpers for the extraction pipeline.
+
+Keeps the results-page readiness logic in one place so every automation
+entry point polls the browser the same way: one batched JS snapshot per
+polling tick instead of several WebDriver round-trips.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import sys
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+# Shared pipeline logger: INFO chatter is coalesced through a MemoryHandler
+# (one write syscall per ~50 records instead of one per line); warnings and
+# errors flush immediately, and flush_logs() is called at step transitions.
+logger = logging.getLogger("pbc_pipeline")
+if not logger.handlers:
+    _stream = logging.StreamHandler(sys.stdout)
+    _stream.setFormatter(logging.Formatter('%(message)s'))
+    _memory = logging.handlers.MemoryHandler(
+        capacity=50, flushLevel=logging.WARNING, target=_stream
+    )
+    logger.addHandler(_memory)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+def flush_logs():
+    """Flush buffered log output (call at workflow state transitions)"""
+    for handler in logger.handlers:
+        handler.flush()
+
+atexit.register(flush_logs)
+
+# Flags that trim Chrome startup and background work - no extensions,
+# translate, sync, or metrics for a headless scrape
+CHROME_PERF_FLAGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees,OptimizationHints",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+    "--disable-client-side-phishing-detection",
+)
+
+class ResultsPageReady:
+    """Mixin providing results-page readiness checks over self.driver"""
+
+    # Single in-browser probe for page state - one WebDriver round-trip
+    # returning everything a polling tick needs
+    JS_SNAPSHOT = """
+        const loader = document.querySelector('.loading, .spinner, [class*="loading"], [class*="spinner"]');
+        return {
+            url: location.href,
+            ready: document.readyState === 'complete',
+            rows: document.querySelectorAll('table tr td').length,
+            loading: !!(loader && loader.offsetParent),
+            noResults: /No (records|results)/i.test(document.body ? document.body.innerText : '')
+        };
+    """
+
+    # Fallback selectors for when the JS probe can't run: unions collapse the
+    # old per-pattern scans into one WebDriver call each, and //table//tr[td]
+    # already covers the tbody/position variants
+    _LOADING_XPATH = ("//div[contains(text(), 'Loading')]"
+                      " | //*[contains(@class, 'loading')]"
+                      " | //*[contains(@class, 'spinner')]")
+    _ROW_XPATH = "//table//tr[td]"
+
+    # MutationObserver that flips window.__resultsReady once the DOM has been
+    # quiet for 500ms - a deterministic "results settled" signal instead of
+    # counting stable polling ticks
+    JS_QUIESCENCE_ARM = """
+        window.__resultsReady = false;
+        let t = setTimeout(() => { window.__resultsReady = true; }, 500);
+        new MutationObserver(() => {
+            clearTimeout(t);
+            t = setTimeout(() => { window.__resultsReady = true; }, 500);
+        }).observe(document.body, {childList: true, subtree: true});
+    """
+
+    _snapshot_cache = None
+
+    def arm_quiescence_probe(self):
+        """Install the DOM-quiescence observer on the current page"""
+        try:
+            self.driver.execute_script(self.JS_QUIESCENCE_ARM)
+            return True
+        except Exception:
+            return False
+
+    def wait_for_quiescence(self, timeout=3):
+        """Poll the observer flag until the DOM settles (bounded, best-effort)"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script("return window.__resultsReady === true")
+            )
+            return True
+        except Exception:
+            return False
+
+    def _snapshot(self):
+        """Return the page-state dict, memoized for the current polling tick"""
+        if self._snapshot_cache is None:
+            self._snapshot_cache = self.driver.execute_script(self.JS_SNAPSHOT)
+        return self._snapshot_cache
+
+    def _invalidate_snapshot(self):
+        """Drop the memoized snapshot at the start of a new polling tick"""
+        self._snapshot_cache = None
+
+    def verify_page_ready(self, timeout=15):
+        """Verify the results page is fully loaded"""
+        logger.info(f"\n✅ Step 2: Verifying Results Page Ready")
+        logger.info("-" * 40)
+
+        def _ready(_driver):
+            # New polling tick - refetch the snapshot
+            self._invalidate_snapshot()
+            return self.has_results_data()
+
+        try:
+            logger.info(f"   Current URL: {self._snapshot()['url']}")
+        except Exception:
+            pass
+
+        # Poll-frequency-controlled wait: returns the moment the page is
+        # ready instead of sleeping out a fixed 5 x 3s schedule
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(_ready)
+            logger.info(f"✅ Page ready with data!")
+            return True
+        except TimeoutException:
+            logger.info("❌ Page verification failed")
+            return False
+
+    def has_results_data(self):
+        """Check if page has actual results data"""
+        try:
+            # One batched JS probe instead of separate XPath round-trips
+            state = self._snapshot()
+
+            if state['loading']:
+                logger.info("   ⏳ Loading indicator still visible")
+                return False
+
+            if state['rows']:
+                logger.info(f"   ✓ Found {state['rows']} data cells")
+
+                if state['ready']:
+                    logger.info("   ✅ DOM ready")
+                    return True
+                else:
+                    logger.info("   ⏳ DOM still loading")
+                    return False
+
+            if state['noResults']:
+                logger.info("   ❌ No results found")
+                return False
+
+            logger.info("   ⏳ No data rows detected yet")
+            return False
+
+        except Exception:
+            # JS probe unavailable - fall back to two union-XPath calls with
+            # short-circuiting is_displayed checks
+            try:
+                loaders = self.driver.find_elements(By.XPATH, self._LOADING_XPATH)
+                if any(elem.is_displayed() for elem in loaders):
+                    logger.info("   ⏳ Loading indicator still visible")
+                    return False
+
+                rows = self.driver.find_elements(By.XPATH, self._ROW_XPATH)
+                if any(elem.is_displayed() for elem in rows):
+                    logger.info(f"   ✓ Found data rows")
+                    return True
+
+                logger.info("   ⏳ No data rows detected yet")
+                return False
+            except Exception:
+                return False
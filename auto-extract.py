@@ -11,358 +11,406 @@ This script provides seamless headless execution:
 Usage: python3 auto-extract.py
 """
 
-import subprocess
+import concurrent.futures
+import csv
+import queue
+import random
+import tempfile
+import threading
 import time
 import sys
 import os
 from datetime import datetime
+from operator import attrgetter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from _driver_helpers import ResultsPageReady, CHROME_PERF_FLAGS, logger, flush_logs
 
-class AutomatedPropertyExtraction:
+class AutomatedPropertyExtraction(ResultsPageReady):
     def __init__(self):
         self.search_process = None
         self.driver = None
-        self.start_time = datetime.now()
+        # Monotonic clock for elapsed-time reporting; wall clock only for the
+        # run tag. One timestamp per run - output filenames stay consistent
+        # and the strftime formatting isn't repeated in the extraction paths
+        self.start_ns = time.monotonic_ns()
+        self.run_tag = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._writer_q = None
+        self._writer_thread = None
         
     def print_header(self):
         """Print header information"""
-        print("🚀 Headless Property Extraction Pipeline")
-        print("=" * 60)
-        print("This will automatically:")
-        print("• Run headless Chrome browser (no visible window)")
-        print("• Fill property search form automatically")  
-        print("• Extract data from ALL pages automatically")
-        print("• Save everything to one CSV file")
-        print("=" * 60)
-        print()
-
-    def create_headless_search_script(self):
-        """Create a temporary headless version of pbc_property_search.py"""
-        print("🔧 Creating headless search script...")
-        
-        try:
-            # Read the original pbc_property_search.py
-            with open('pbc_property_search.py', 'r') as f:
-                original_script = f.read()
-            
-            # Modify it to be headless
-            headless_script = original_script.replace(
-                'chrome_options.add_argument("--remote-debugging-port=9222")',
-                '''chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--remote-debugging-port=9222")'''
-            )
-            
-            # Write temporary headless version
-            with open('temp_headless_search.py', 'w') as f:
-                f.write(headless_script)
-            
-            print("✅ Created temporary headless search script")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error creating headless script: {e}")
-            return False
-    
+        logger.info("🚀 Headless Property Extraction Pipeline")
+        logger.info("=" * 60)
+        logger.info("This will automatically:")
+        logger.info("• Run headless Chrome browser (no visible window)")
+        logger.info("• Fill property search form automatically")  
+        logger.info("• Extract data from ALL pages automatically")
+        logger.info("• Save everything to one CSV file")
+        logger.info("=" * 60)
+        logger.info('')
+
     def run_headless_search(self):
-        """Run property search using modified headless version"""
-        print("🔍 Step 1: Running Headless Property Search...")
-        print("-" * 40)
-        
+        """Run the property search in-process with a headless driver"""
+        logger.info("🔍 Step 1: Running Headless Property Search...")
+        logger.info("-" * 40)
+
         try:
-            # Create headless version of search script
-            if not self.create_headless_search_script():
-                return False
-            
-            # Run the headless search script
-            print("🚀 Starting headless property search with anti-bot measures...")
-            result = subprocess.run([
-                sys.executable, 'temp_headless_search.py'
-            ], capture_output=True, text=True, timeout=180)  # 3 minute timeout
-            
-            if result.returncode == 0:
-                print("✅ Headless search completed successfully!")
-                
-                # Connect to the headless browser
-                time.sleep(5)  # Give time for browser to settle
-                
-                try:
-                    chrome_options = Options()
-                    chrome_options.add_experimental_option("debuggerAddress", "localhost:9222")
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                    
-                    current_url = self.driver.current_url
-                    print(f"🎯 Connected to headless browser: {current_url}")
-                    
-                    # Check if we're on results page
-                    if 'GetSalesSearch' in current_url:
-                        print("✅ Successfully on results page!")
-                        return True
-                    else:
-                        print(f"⚠️ Not on expected results page, continuing anyway...")
-                        return True
-                        
-                except Exception as e:
-                    print(f"⚠️ Could not connect to headless browser: {e}")
-                    return False
-                    
+            logger.info("🚀 Starting headless property search with anti-bot measures...")
+            from pbc_property_search import run as run_search
+            self.driver = run_search(headless=True)
+
+            current_url = self.driver.current_url
+            logger.info(f"🎯 Headless search finished on: {current_url}")
+
+            # Check if we're on results page
+            if 'GetSalesSearch' in current_url:
+                logger.info("✅ Successfully on results page!")
             else:
-                print(f"❌ Search script failed with return code: {result.returncode}")
-                if result.stdout:
-                    print(f"Output: {result.stdout}")
-                if result.stderr:
-                    print(f"Error: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            print("⏰ Search script timeout - may still be running")
-            # Try to connect anyway
+                logger.info(f"⚠️ Not on expected results page, continuing anyway...")
+            return True
+
+        except ImportError:
+            logger.info("❌ Could not import pbc_property_search")
+            return False
+        except Exception as e:
+            logger.info(f"❌ Error in headless search: {e}")
+            # Fallback: a previous search may have left a debuggable Chrome behind
             try:
                 chrome_options = Options()
-                chrome_options.add_experimental_option("debuggerAddress", "localhost:9222") 
+                chrome_options.add_experimental_option("debuggerAddress", "localhost:9222")
+                chrome_options.page_load_strategy = "eager"
                 self.driver = webdriver.Chrome(options=chrome_options)
                 return True
-            except:
+            except Exception:
                 return False
-                
-        except Exception as e:
-            print(f"❌ Error in headless search: {e}")
-            return False
-        
-        finally:
-            # Cleanup temporary file
-            try:
-                if os.path.exists('temp_headless_search.py'):
-                    os.remove('temp_headless_search.py')
-                    print("🧹 Cleaned up temporary files")
-            except:
-                pass
-
-    def verify_page_ready(self):
-        """Verify the results page is fully loaded"""
-        print(f"\n✅ Step 2: Verifying Results Page Ready")
-        print("-" * 40)
-        
-        max_attempts = 5
-        
-        for attempt in range(1, max_attempts + 1):
-            print(f"🔍 Verification attempt {attempt}/{max_attempts}...")
-            
-            try:
-                current_url = self.driver.current_url
-                print(f"   Current URL: {current_url}")
-                
-                # Check for data content
-                if self.has_results_data():
-                    print(f"✅ Page ready with data! (attempt {attempt})")
-                    return True
-                else:
-                    print(f"⏳ Data still loading... (attempt {attempt})")
-                    time.sleep(3)
-                    
-            except Exception as e:
-                print(f"⚠️ Verification error: {str(e)[:50]}")
-                time.sleep(3)
-        
-        print("❌ Page verification failed")
-        return False
 
-    def has_results_data(self):
-        """Check if page has actual results data"""
+    # verify_page_ready / has_results_data come from ResultsPageReady
+
+    def _page_url_template(self):
+        """Build a page-addressable URL template from the current results URL.
+
+        Returns a format string with a {page} placeholder, or None when the
+        URL carries no page parameter (click-based navigation is used then).
+        """
+        from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
         try:
-            # Check for loading indicators (should be absent)
-            loading_selectors = [
-                "//div[contains(text(), 'Loading')]",
-                "//*[contains(@class, 'loading')]",
-                "//*[contains(@class, 'spinner')]"
-            ]
-            
-            for selector in loading_selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                if any(elem.is_displayed() for elem in elements):
-                    print("   ⏳ Loading indicator still visible")
-                    return False
-            
-            # Check for actual data rows
-            data_selectors = [
-                "//table//tr[td]",
-                "//tbody//tr[td]", 
-                "//table//tr[position()>1 and td]"
-            ]
-            
-            for selector in data_selectors:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                visible_rows = [elem for elem in elements if elem.is_displayed()]
-                if visible_rows:
-                    print(f"   ✓ Found {len(visible_rows)} data rows")
-                    
-                    # Check DOM is ready
-                    dom_ready = self.driver.execute_script("return document.readyState") == "complete"
-                    if dom_ready:
-                        print("   ✅ DOM ready")
-                        return True
-                    else:
-                        print("   ⏳ DOM still loading")
-                        return False
-            
-            # Check for "no results" messages
-            no_results = self.driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'No records') or contains(text(), 'No results')]")
-            if any(elem.is_displayed() for elem in no_results):
-                print("   ❌ No results found")
-                return False
-            
-            print("   ⏳ No data rows detected yet")
-            return False
-            
+            parts = urlsplit(self.driver.current_url)
         except Exception:
+            return None
+
+        found = False
+        rebuilt = []
+        for key, value in parse_qsl(parts.query, keep_blank_values=True):
+            if not found and key.lower() in ('page', 'pagenum', 'pagenumber', 'pageindex'):
+                rebuilt.append((key, '{page}'))
+                found = True
+            else:
+                rebuilt.append((key, value))
+
+        if not found:
+            return None
+
+        return urlunsplit(parts._replace(query=urlencode(rebuilt, safe='{}')))
+
+    def wait_for_next_page(self, ref_row, timeout=8):
+        """Wait until the old page's rows go stale and the new table is attached"""
+        try:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=0.25)
+            if ref_row is not None:
+                wait.until(EC.staleness_of(ref_row))
+            wait.until(EC.presence_of_all_elements_located((By.XPATH, "//table//tr[td]")))
+            # Rows are attached; give the table a bounded window to stop
+            # mutating so we don't scrape a half-rendered page
+            if self.arm_quiescence_probe():
+                self.wait_for_quiescence(timeout=3)
+            return True
+        except TimeoutException:
+            logger.info("⚠️ New page table not detected within timeout, continuing anyway...")
             return False
 
     def run_headless_extraction(self):
         """Run multi-page extraction using current headless driver with guaranteed CSV output"""
-        print(f"\n📊 Step 3: Running Headless Data Extraction")
-        print("-" * 40)
+        logger.info(f"\n📊 Step 3: Running Headless Data Extraction")
+        logger.info("-" * 40)
         
         extractor = None
         csv_file = None
         
         try:
             # Import the multi-page extractor and run it with our driver
-            from multi_page_extractor import MultiPageExtractor
-            
-            print("🔄 Initializing headless extractor...")
+            from multi_page_extractor import MultiPageExtractor, CSV_FIELDS
+
+            logger.info("🔄 Initializing headless extractor...")
             extractor = MultiPageExtractor(debug_mode=True)
-            
+
             # Use our existing headless driver
             extractor.driver = self.driver
-            
-            print("🚀 Starting multi-page data extraction...")
+
+            # Stream records to disk from a background writer thread - the
+            # scrape thread never blocks on file I/O, and the file itself is
+            # the incremental checkpoint
+            csv_file = f"extracted/property_data_{self.run_tag}.csv"
+            self._writer_q = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._csv_writer_worker,
+                args=(self._writer_q, csv_file, CSV_FIELDS),
+                daemon=True
+            )
+            self._writer_thread.start()
+            total_records = 0
+
+            logger.info("🚀 Starting multi-page data extraction...")
             
             # Run the extraction directly
             extractor.total_pages = extractor.detect_total_pages()
             
             if extractor.total_pages:
-                print(f"📊 Total pages detected: {extractor.total_pages}")
+                logger.info(f"📊 Total pages detected: {extractor.total_pages}")
                 actual_max_pages = min(50, extractor.total_pages)
             else:
-                print(f"🔍 Page count unknown, will detect during navigation (max 50)")
+                logger.info(f"🔍 Page count unknown, will detect during navigation (max 50)")
                 actual_max_pages = 50
             
             # Get current page number
             extractor.current_page = extractor.get_current_page_number()
-            print(f"📍 Starting from page: {extractor.current_page}")
+            logger.info(f"📍 Starting from page: {extractor.current_page}")
             
             page_number = extractor.current_page
             consecutive_empty_pages = 0
-            
+
+            # Prefer direct page-URL navigation over clicking Next each time
+            page_template = self._page_url_template()
+            if page_template:
+                logger.info(f"🔗 Page-addressable results URL detected, navigating by URL")
+
+
             try:
                 while page_number <= actual_max_pages:
-                    print(f"\n📄 Processing Page {page_number}")
+                    logger.info(f"\n📄 Processing Page {page_number}")
                     if extractor.total_pages:
-                        print(f"    Progress: {page_number}/{extractor.total_pages} ({(page_number/extractor.total_pages*100):.1f}%)")
-                    print("-" * 40)
+                        logger.info(f"    Progress: {page_number}/{extractor.total_pages} ({(page_number/extractor.total_pages*100):.1f}%)")
+                    logger.info("-" * 40)
                     
                     # Extract data from current page
                     page_records = extractor.extract_current_page_data(page_number)
                     
                     if page_records:
-                        extractor.all_records.extend(page_records)
+                        self._writer_q.put(page_records)
+                        total_records += len(page_records)
                         consecutive_empty_pages = 0
-                        print(f"📊 Page {page_number}: {len(page_records)} records")
-                        print(f"📈 Total so far: {len(extractor.all_records)} records")
-                        
-                        # Save incremental results every 5 pages (backup)
-                        if page_number % 5 == 0:
-                            try:
-                                backup_file = extractor.save_results_to_csv(filename=f"extracted/backup_page_{page_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-                                print(f"💾 Incremental backup saved: {backup_file}")
-                            except:
-                                pass  # Don't fail extraction for backup issues
+                        logger.info(f"📊 Page {page_number}: {len(page_records)} records")
+                        logger.info(f"📈 Total so far: {total_records} records")
                     else:
                         consecutive_empty_pages += 1
-                        print(f"⚠️ Page {page_number}: No data found")
+                        logger.info(f"⚠️ Page {page_number}: No data found")
                         
                         if consecutive_empty_pages >= 3:
-                            print("🛑 Found 3 consecutive empty pages. Stopping extraction.")
+                            logger.info("🛑 Found 3 consecutive empty pages. Stopping extraction.")
                             break
                     
                     # Check if we've reached the known total
                     if extractor.total_pages and page_number >= extractor.total_pages:
-                        print(f"🏁 Reached final page ({extractor.total_pages}). Extraction complete.")
+                        logger.info(f"🏁 Reached final page ({extractor.total_pages}). Extraction complete.")
                         break
                     
-                    # Try to navigate to next page
-                    if not extractor.navigate_to_next_page(page_number):
-                        print(f"🏁 No more pages found. Extraction complete.")
+                    # Capture a current row so we can wait on its staleness after navigation
+                    try:
+                        ref_row = self.driver.find_element(By.XPATH, "//table//tr[td]")
+                    except Exception:
+                        ref_row = None
+
+                    # Navigate directly by URL when the page number is encoded
+                    # in it - one navigation instead of a click-find-wait triplet
+                    if page_template:
+                        self.driver.get(page_template.format(page=page_number + 1))
+                    elif not extractor.navigate_to_next_page(page_number):
+                        logger.info(f"🏁 No more pages found. Extraction complete.")
                         break
-                    
+
                     page_number += 1
                     extractor.current_page = page_number
-                    
-                    # Wait 8 seconds between pages
+
+                    # Wait only until the new page's table is attached (max 8 seconds)
                     if page_number <= actual_max_pages:
-                        if extractor.total_pages:
-                            print(f"⏱️ Waiting 8 seconds before processing page {page_number}/{extractor.total_pages}...")
-                        else:
-                            print(f"⏱️ Waiting 8 seconds before processing page {page_number}...")
-                        time.sleep(8)
+                        self.wait_for_next_page(ref_row)
                         
             except KeyboardInterrupt:
-                print(f"\n⏹️ Extraction interrupted by user at page {page_number}")
-                print(f"📊 Partial results: {len(extractor.all_records)} records extracted")
-            
-            # Always save results (complete or partial)
-            print(f"\n💾 Saving final results...")
-            print("=" * 60)
-            print(f"📊 Total pages processed: {page_number}")
-            print(f"📊 Total records extracted: {len(extractor.all_records)}")
-            
-            if extractor.all_records:
-                csv_file = extractor.save_results_to_csv(filename=f"extracted/property_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-                print(f"✅ Final results saved to: {csv_file}")
-                
-                # Clean up backup files
-                try:
-                    import glob
-                    backup_files = glob.glob("extracted/backup_page_*.csv")
-                    for backup in backup_files:
-                        os.remove(backup)
-                    if backup_files:
-                        print(f"🧹 Cleaned up {len(backup_files)} backup files")
-                except:
-                    pass
-                
+                logger.info(f"\n⏹️ Extraction interrupted by user at page {page_number}")
+                logger.info(f"📊 Partial results: {total_records} records already on disk")
+
+            # All records are already streamed to disk (complete or partial)
+            self._finish_csv_writer()
+            logger.info(f"\n💾 Finalizing results...")
+            logger.info("=" * 60)
+            logger.info(f"📊 Total pages processed: {page_number}")
+            logger.info(f"📊 Total records extracted: {total_records}")
+
+            if total_records:
+                logger.info(f"✅ Final results saved to: {csv_file}")
                 return True
             else:
-                print("⚠️ No records were extracted")
+                logger.info("⚠️ No records were extracted")
                 return False
-                
+
         except ImportError:
-            print("❌ Could not import multi_page_extractor")
+            logger.info("❌ Could not import multi_page_extractor")
             return False
         except Exception as e:
-            print(f"❌ Headless extraction error: {e}")
-            
-            # Still try to save any partial results
-            if extractor and extractor.all_records:
-                try:
-                    print(f"💾 Attempting to save partial results...")
-                    csv_file = extractor.save_results_to_csv(filename=f"extracted/partial_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-                    print(f"✅ Partial results saved to: {csv_file}")
-                except Exception as save_error:
-                    print(f"❌ Could not save partial results: {save_error}")
-            
+            logger.info(f"❌ Headless extraction error: {e}")
+
+            # Whatever was extracted so far is already streamed to disk
+            self._finish_csv_writer()
+            if csv_file:
+                logger.info(f"💾 Partial results are on disk at: {csv_file}")
+
             return False
 
+    def run_parallel_extraction(self, k=4, max_pages=50):
+        """Extract pages with a pool of headless Chrome workers sharing a page queue.
+
+        Result pages are independent, so K workers fetching page URLs directly
+        give near-linear speedup over the serial navigate/extract loop. Falls
+        back to run_headless_extraction when the results URL is not
+        page-addressable.
+        """
+        logger.info(f"\n📊 Step 3 (parallel): Running Extraction with {k} Chrome Workers")
+        logger.info("-" * 40)
+
+        try:
+            from multi_page_extractor import MultiPageExtractor
+        except ImportError:
+            logger.info("❌ Could not import multi_page_extractor")
+            return False
+
+        # Workers can only fetch pages directly when the page number is
+        # encoded in the URL; a blind page=N append would silently re-fetch
+        # page 1 K times on servers that ignore unknown parameters
+        page_template = self._page_url_template()
+        if page_template is None:
+            logger.info("⚠️ Results URL is not page-addressable, falling back to serial extraction")
+            return self.run_headless_extraction()
+
+        extractor = MultiPageExtractor(debug_mode=False)
+        extractor.driver = self.driver
+
+        total_pages = extractor.detect_total_pages()
+        if total_pages:
+            total_pages = min(total_pages, max_pages)
+            logger.info(f"📊 Total pages detected: {total_pages}")
+        else:
+            logger.info("⚠️ Page count unknown, falling back to serial extraction")
+            return self.run_headless_extraction()
+
+        tls = threading.local()
+        workers = []
+        workers_lock = threading.Lock()
+        records_lock = threading.Lock()
+
+        def make_worker_driver():
+            options = Options()
+            options.add_argument("--headless")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument(f"--user-data-dir={tempfile.mkdtemp(prefix='pbc_worker_')}")
+            options.page_load_strategy = "eager"
+            for flag in CHROME_PERF_FLAGS:
+                options.add_argument(flag)
+            return webdriver.Chrome(options=options)
+
+        def fetch(page):
+            if not hasattr(tls, 'driver'):
+                # Stagger worker start by 100-300ms so we don't hammer the server
+                time.sleep(random.uniform(0.1, 0.3))
+                tls.driver = make_worker_driver()
+                tls.extractor = MultiPageExtractor(debug_mode=False)
+                tls.extractor.driver = tls.driver
+                with workers_lock:
+                    workers.append(tls.driver)
+
+            tls.driver.get(page_template.format(page=page))
+            WebDriverWait(tls.driver, 10, poll_frequency=0.25).until(
+                EC.presence_of_all_elements_located((By.XPATH, "//table//tr[td]"))
+            )
+            return tls.extractor.extract_current_page_data(page)
+
+        # Stream records straight to disk as pages complete; the lock keeps
+        # whole pages contiguous in the output
+        csv_file = extractor.open_csv_stream(filename=f"extracted/property_data_{self.run_tag}.csv")
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=k) as pool:
+                futures = {pool.submit(fetch, page): page for page in range(1, total_pages + 1)}
+                for future in concurrent.futures.as_completed(futures):
+                    page = futures[future]
+                    try:
+                        page_records = future.result()
+                    except Exception as e:
+                        logger.info(f"⚠️ Page {page} failed: {e}")
+                        continue
+                    with records_lock:
+                        extractor.write_page_records(page_records)
+                    logger.info(f"📊 Page {page}: {len(page_records)} records (total {extractor.total_records})")
+        finally:
+            for worker_driver in workers:
+                try:
+                    worker_driver.quit()
+                except Exception:
+                    pass
+            extractor.close_csv_stream()
+
+        if not extractor.total_records:
+            logger.info("⚠️ Parallel extraction found no records, falling back to serial extraction")
+            return self.run_headless_extraction()
+
+        logger.info(f"\n💾 Results streamed to disk during extraction")
+        logger.info(f"📊 Total records extracted: {extractor.total_records}")
+        logger.info(f"✅ Final results saved to: {csv_file}")
+        return True
+
+    @staticmethod
+    def _preimport_extractor():
+        """Import multi_page_extractor off the critical path"""
+        try:
+            import multi_page_extractor  # noqa: F401
+        except Exception:
+            pass  # Step 3 reports the import failure properly
+
+    @staticmethod
+    def _csv_writer_worker(writer_q, path, fieldnames):
+        """Consume record batches from the queue and append them to the CSV"""
+        get_row = attrgetter(*fieldnames)
+        with open(path, 'w', newline='', encoding='utf-8') as fp:
+            writer = csv.writer(fp)
+            writer.writerow(fieldnames)
+            while True:
+                batch = writer_q.get()
+                if batch is None:
+                    break
+                writer.writerows(map(get_row, batch))
+                fp.flush()
+
+    def _finish_csv_writer(self):
+        """Signal the background CSV writer to drain and wait for it"""
+        if self._writer_q is not None:
+            self._writer_q.put(None)
+            self._writer_q = None
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=30)
+            self._writer_thread = None
+
     def cleanup(self):
         """Clean up resources"""
+        self._finish_csv_writer()
         try:
             if self.driver:
-                print("🧹 Closing headless browser...")
+                logger.info("🧹 Closing headless browser...")
                 self.driver.quit()
         except:
             pass
@@ -370,62 +418,86 @@ class AutomatedPropertyExtraction:
     def run(self):
         """Main headless execution workflow"""
         self.print_header()
-        
+
+        # Warm the extractor's import chain while the search is busy in the
+        # browser, so step 3 starts with the module already loaded
+        preimport = threading.Thread(
+            target=self._preimport_extractor, daemon=True
+        )
+        preimport.start()
+
         try:
             # Step 1: Run headless search
             if not self.run_headless_search():
-                print("\n❌ Headless search failed")
-                print("Check: Network connection, website changes, Chrome installation")
+                logger.info("\n❌ Headless search failed")
+                logger.info("Check: Network connection, website changes, Chrome installation")
                 return False
-            
+            flush_logs()
+
             # Step 2: Verify page ready
             if not self.verify_page_ready():
-                print("\n❌ Results page not ready")
-                print("Check: Search results, page rendering, data loading")
+                logger.info("\n❌ Results page not ready")
+                logger.info("Check: Search results, page rendering, data loading")
                 return False
-            
-            # Step 3: Run headless extraction
-            if not self.run_headless_extraction():
-                print("\n❌ Data extraction failed")
+            flush_logs()
+
+            # Step 3: Run headless extraction. Opt into the worker pool with
+            # PBC_PARALLEL_WORKERS=N; it falls back to the serial loop when
+            # the results URL is not page-addressable
+            try:
+                parallel_workers = int(os.environ.get('PBC_PARALLEL_WORKERS', '0'))
+            except ValueError:
+                parallel_workers = 0
+
+            if parallel_workers > 1:
+                extracted = self.run_parallel_extraction(k=parallel_workers)
+            else:
+                extracted = self.run_headless_extraction()
+
+            if not extracted:
+                logger.info("\n❌ Data extraction failed")
                 return False
             
             # Success
-            total_time = datetime.now() - self.start_time
-            print(f"\n🎉 HEADLESS EXTRACTION COMPLETE!")
-            print("=" * 60)
-            print(f"⏱️  Total time: {total_time}")
-            print("📁 Check 'extracted' folder for CSV file")
-            print("🎯 All property data consolidated!")
-            print("🤖 Completed entirely in headless mode!")
+            total_s = (time.monotonic_ns() - self.start_ns) / 1e9
+            logger.info(f"\n🎉 HEADLESS EXTRACTION COMPLETE!")
+            logger.info("=" * 60)
+            logger.info(f"⏱️  Total time: {total_s:.1f}s")
+            logger.info("📁 Check 'extracted' folder for CSV file")
+            logger.info("🎯 All property data consolidated!")
+            logger.info("🤖 Completed entirely in headless mode!")
             
             return True
             
         except KeyboardInterrupt:
-            print(f"\n⏹️  Process interrupted")
+            logger.info(f"\n⏹️  Process interrupted")
         except Exception as e:
-            print(f"\n❌ Unexpected error: {e}")
+            logger.info(f"\n❌ Unexpected error: {e}")
         finally:
             self.cleanup()
+            flush_logs()
         
         return False
 
 def main():
     """Main entry point"""
-    print("Starting Headless Property Extraction...")
-    print(f"Working directory: {os.getcwd()}\n")
+    logger.info("Starting Headless Property Extraction...")
+    logger.info(f"Working directory: {os.getcwd()}\n")
     
-    # Check required files
+    # Check required files - one scandir of the cwd instead of a stat per file
     required_files = ['pbc_property_search.py', 'multi_page_extractor.py']
-    missing = [f for f in required_files if not os.path.exists(f)]
-    
+    present = {entry.name for entry in os.scandir('.')}
+    missing = [f for f in required_files if f not in present]
+
     if missing:
-        print("❌ Missing files:")
+        logger.info("❌ Missing files:")
         for file in missing:
-            print(f"   • {file}")
+            logger.info(f"   • {file}")
         return False
     
     # Create output directory
-    os.makedirs("extracted", exist_ok=True)
+    if not os.path.isdir("extracted"):
+        os.mkdir("extracted")
     
     # Run headless automation
     automation = AutomatedPropertyExtraction()
@@ -21,14 +21,101 @@ import json
 import time
 import re
 import os
+import sys
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from collections import OrderedDict
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
+import lxml.html
+import requests
 import random
 
-@dataclass
+# Optional C-backed HTML parser - an order of magnitude faster than
+# BeautifulSoup for the full-page text fallback; bs4/lxml remain the
+# fallback when selectolax isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional Rust-backed JSON serializer for the end-of-run backup; handles
+# dataclasses natively so no per-record asdict pass is needed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import - results-page heuristics matched per check
+_URL_RE = re.compile(r'getsalessearch|search|result|property', re.I)
+_TITLE_RE = re.compile(r'search|result|property|sales', re.I)
+
+# Text-cleaning patterns (_clean_papa_text runs once per cell)
+_WS_RE = re.compile(r'\s+')
+_TRIM_RE = re.compile(r'^[:\-\s]+|[:\-\s]+$')
+_CURRENCY_RE = re.compile(r'\$\s*(\d)')
+
+# Property-content sniff used on table text and text-mode blocks - one
+# C-level regex scan instead of a Python loop of substring checks
+_BLOCK_KEYWORDS_RE = re.compile(r'palm beach|parcel|property|owner|address|value|account', re.I)
+
+# Block separators for the text-mode fallback (blank lines, tab runs,
+# underscore/dash rules)
+_BLOCK_SPLIT_RE = re.compile(r'\n\s*\n|\t\t+|_{3,}|-{3,}')
+
+# Row-level extraction patterns (_extract_papa_patterns runs once per row).
+# All field patterns are fused into one alternation scanned with a single
+# finditer pass; the named group that matched identifies the target field
+# via _MEGA_FIELDS, and first match per field wins.
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_MEGA_RE = re.compile('|'.join([
+    # Parcel number (PAPA format first, then labelled variants)
+    r'(?P<parcel_a>[0-9]{2}-[0-9]{4}-[0-9]{3}-[0-9]{4})',
+    r'PCN[:\s]*(?P<parcel_b>[A-Z0-9\-]+)',
+    r'Parcel[:\s]*(?P<parcel_c>[A-Z0-9\-]+)',
+    # Property address
+    r'(?P<addr_a>\d+\s+[A-Z\s]+(?:ST|AVE|RD|DR|LN|CT|PL|WAY|BLVD|CIR)(?:\s+(?:APT|UNIT|STE)\s*[\w\d]+)?)',
+    r'(?P<addr_b>\d+\s+[A-Z][A-Z\s]+[A-Z](?:\s+(?:STREET|AVENUE|ROAD|DRIVE|LANE|COURT|PLACE|WAY|BOULEVARD|CIRCLE)))',
+    # Values with currency formatting
+    r'Just Value[:\s]*\$(?P<value_a>[0-9,]+)',
+    r'Market Value[:\s]*\$(?P<value_b>[0-9,]+)',
+    r'Total Value[:\s]*\$(?P<value_c>[0-9,]+)',
+    # Acreage
+    r'(?P<acres_a>[0-9]+\.?[0-9]*) acre[s]?',
+    r'Acres?[:\s]*(?P<acres_b>[0-9]+\.?[0-9]*)',
+    r'(?P<acres_c>[0-9]+\.?[0-9]*) ac\b',
+    # Mail city, state, zip
+    r'Mail(?=.*?(?P<mail_b>[A-Z\s]+,\s*[A-Z]{2}\s+[0-9]{5}))',
+    r'Owner(?=.*?(?P<mail_c>[A-Z\s]+,\s*FL\s+[0-9]{5}))',
+    r'(?P<mail_a>[A-Z\s]+,\s*[A-Z]{2}\s+[0-9]{5}(?:-[0-9]{4})?)',
+    # Homestead status
+    r'Homesteade?d?[:\s]*(?P<home_a>Yes|No|Y|N)',
+    r'(?P<home_b>Homestead Exemption)',
+    r'(?P<home_c>Yes)(?=.*?homestead)',
+    r'(?P<home_d>No)(?=.*?homestead)',
+    # Lot size
+    r'Lot Size[:\s]*(?P<lot_a>[0-9,]+)\s*sq\s*ft',
+    r'Land Area[:\s]*(?P<lot_b>[0-9,]+)',
+    r'(?P<lot_c>[0-9,]+)\s*sq\s*ft\s*lot',
+]), re.I)
+
+_MEGA_FIELDS = {
+    'parcel_a': 'parcel_number', 'parcel_b': 'parcel_number', 'parcel_c': 'parcel_number',
+    'addr_a': 'property_address', 'addr_b': 'property_address',
+    'value_a': 'property_value', 'value_b': 'property_value', 'value_c': 'property_value',
+    'acres_a': 'acres', 'acres_b': 'acres', 'acres_c': 'acres',
+    'mail_a': 'mail_city_state_zip', 'mail_b': 'mail_city_state_zip', 'mail_c': 'mail_city_state_zip',
+    'home_a': 'homesteaded', 'home_b': 'homesteaded', 'home_c': 'homesteaded', 'home_d': 'homesteaded',
+    'lot_a': 'lot_size', 'lot_b': 'lot_size', 'lot_c': 'lot_size',
+}
+
+# slots=True drops the per-instance __dict__ - with 35 string fields that's
+# a large saving across thousands of records, and attribute access is faster
+@dataclass(slots=True)
 class PropertyRecord:
     """Enhanced data structure for PAPA property information with required fields"""
     # Primary identification
@@ -79,15 +166,102 @@ class PropertyRecord:
     record_url: str = ""
     extraction_date: str = ""
 
+# Every PropertyRecord field is an atomic str, so a flat getattr sweep gives
+# the same dict as asdict() without its recursive deep-copy machinery
+_RECORD_FIELDS = tuple(f.name for f in fields(PropertyRecord))
+
+def _record_to_dict(record: PropertyRecord) -> Dict[str, str]:
+    """Flat dict view of a record - cheap substitute for asdict()"""
+    return {name: getattr(record, name) for name in _RECORD_FIELDS}
+
+# CSV layout, built once at import time: field order with required fields
+# first, friendly display names, and the attrgetter that pulls a whole row
+# in a single C call
+_CSV_FIELD_ORDER = (
+    'parcel_number', 'sale_price', 'sale_date', 'owner_name',
+    'property_address', 'municipality', 'square_footage',
+    'mail_address', 'mail_city_state_zip', 'homesteaded',
+    'acres', 'lot_size', 'zoning',
+    'property_value', 'assessed_value', 'market_value', 'taxable_value',
+    'year_built', 'bedrooms', 'bathrooms', 'half_baths',
+    'property_type', 'property_use', 'building_class',
+    'account_number', 'folio_number', 'deed_book',
+    'neighborhood', 'subdivision', 'land_use_code', 'school_district',
+    'tax_amount', 'exemption_amount',
+    'record_url', 'additional_info', 'extraction_date'
+)
+
+_FRIENDLY_HEADERS = {
+    'property_address': 'Property Address',
+    'owner_name': 'Owner Name',
+    'property_value': 'Property Value',
+    'assessed_value': 'Assessed Value',
+    'market_value': 'Market Value',
+    'taxable_value': 'Taxable Value',
+    'square_footage': 'Square Footage',
+    'year_built': 'Year Built',
+    'bedrooms': 'Bedrooms',
+    'bathrooms': 'Bathrooms',
+    'half_baths': 'Half Baths',
+    'property_type': 'Property Type',
+    'property_use': 'Property Use',
+    'building_class': 'Building Class',
+    'account_number': 'Account Number',
+    'folio_number': 'Folio Number',
+    'sale_price': 'Sale Price',
+    'sale_date': 'Sale Date',
+    'deed_book': 'Deed Book',
+    'municipality': 'Municipality',
+    'neighborhood': 'Neighborhood',
+    'subdivision': 'Subdivision',
+    'zoning': 'Zoning',
+    'land_use_code': 'Land Use Code',
+    'school_district': 'School District',
+    'tax_amount': 'Tax Amount',
+    'exemption_amount': 'Exemption Amount',
+    'record_url': 'Record URL',
+    'additional_info': 'Additional Info',
+    'extraction_date': 'Extraction Date'
+}
+
+_CSV_HEADER = tuple(_FRIENDLY_HEADERS.get(field, field) for field in _CSV_FIELD_ORDER)
+_CSV_GET = attrgetter(*_CSV_FIELD_ORDER)
+
+# Key fields shown in the post-export sample view
+_SAMPLE_LABELS = (
+    'Property Address', 'Owner Name', 'Property Value', 'Square Footage',
+    'Municipality', 'Year Built', 'Sale Price', 'Sale Date'
+)
+_SAMPLE_GET = attrgetter(
+    'property_address', 'owner_name', 'property_value', 'square_footage',
+    'municipality', 'year_built', 'sale_price', 'sale_date'
+)
+
 class EnhancedPropertyExtractor:
     """Enhanced extractor with PAPA-specific improvements"""
-    
-    def __init__(self, debug_mode: bool = False):
+
+    # Request patterns blocked over CDP during extraction - analytics and
+    # font downloads the extractor never uses; override via blocked_patterns
+    DEFAULT_BLOCKED_PATTERNS = [
+        '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+        '*.woff', '*.woff2', '*.png', '*.jpg',
+    ]
+
+    def __init__(self, debug_mode: bool = False, blocked_patterns: List[str] = None):
         self.debug_mode = debug_mode
+        self.blocked_patterns = (self.DEFAULT_BLOCKED_PATTERNS
+                                 if blocked_patterns is None else blocked_patterns)
         self.setup_logging()
         self.driver = None
         self.wait = None
-        
+        self._session = None
+        # Detail pages memoized by URL - duplicate parcels across pages
+        # don't refetch; bounded LRU via OrderedDict eviction
+        self._detail_cache = OrderedDict()
+        # One timestamp per extraction run; stamped onto every record instead
+        # of calling datetime.now().strftime() per row
+        self._run_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
     def setup_logging(self):
         """Configure logging"""
         log_level = logging.DEBUG if self.debug_mode else logging.INFO
@@ -113,9 +287,28 @@ class EnhancedPropertyExtractor:
             
             # Natural user agent
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
+
+            # The extractor only reads the DOM - skip images and stylesheets
+            # and return from driver.get at DOMContentLoaded
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.default_content_setting_values.cookies": 1,
+            })
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.page_load_strategy = 'eager'
+
             self.driver = webdriver.Chrome(options=chrome_options)
-            
+
+            # Block trackers/fonts at the network layer via CDP
+            if self.blocked_patterns:
+                try:
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd(
+                        'Network.setBlockedURLs', {'urls': self.blocked_patterns})
+                except Exception as e:
+                    self.logger.debug(f"CDP URL blocking unavailable: {e}")
+
             # Remove automation indicators
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
@@ -149,12 +342,17 @@ class EnhancedPropertyExtractor:
             print(f"URL: {current_url}")
             
             # Check if this looks like a results page
-            if any(indicator in current_url.lower() for indicator in ['search', 'result']) or \
-               any(indicator in page_title.lower() for indicator in ['search', 'result', 'property']):
+            if _URL_RE.search(current_url) or _TITLE_RE.search(page_title):
                 print("✅ Already connected to what appears to be a search results page!")
                 
                 print("🚀 Proceeding with extraction automatically...")
-                self.natural_delay(1, 2)
+                # Proceed the instant result content is present instead of
+                # sleeping a fixed 1-2s
+                try:
+                    self.wait.until(EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "table, tr[class*='result']")))
+                except TimeoutException:
+                    self.logger.warning("No result content detected yet, proceeding anyway")
                 return True
         except Exception as e:
             self.logger.error(f"Error checking current page: {e}")
@@ -172,7 +370,11 @@ class EnhancedPropertyExtractor:
             self.logger.info(f"Starting extraction on: {page_title} - {current_url}")
             
             # Wait for page to be fully loaded
-            self.natural_delay(2, 4)
+            try:
+                self.wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "table, tr[class*='result']")))
+            except TimeoutException:
+                self.logger.warning("No result content detected yet, proceeding anyway")
             return True
                     
         except Exception as e:
@@ -193,37 +395,48 @@ class EnhancedPropertyExtractor:
         }
         
         try:
-            # Look for PAPA-specific result tables
+            # Look for PAPA-specific result tables. Row count and header row
+            # come back in one execute_script call - the old per-table .text
+            # serialized the entire table content across the bridge just to
+            # sniff a handful of keywords
             tables = self.driver.find_elements(By.TAG_NAME, "table")
-            for i, table in enumerate(tables):
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                if len(rows) > 1:
-                    # Check if this looks like a results table
-                    header_text = table.text.lower()
-                    if any(keyword in header_text for keyword in [
-                        'property', 'address', 'owner', 'value', 'parcel', 'account'
-                    ]):
-                        analysis['tables'].append({
-                            'index': i,
-                            'rows': len(rows),
-                            'element': table
-                        })
+            table_meta = self.driver.execute_script("""
+                return arguments[0].map(t => ({
+                    rows: t.rows.length,
+                    header: t.rows.length ? t.rows[0].innerText : ''
+                }));
+            """, tables)
+            for i, (table, meta) in enumerate(zip(tables, table_meta)):
+                if meta['rows'] > 1 and _BLOCK_KEYWORDS_RE.search(meta['header']):
+                    analysis['tables'].append({
+                        'index': i,
+                        'rows': meta['rows'],
+                        'element': table
+                    })
             
+            # Remaining structure probes run as local lxml XPath over one
+            # page_source pull instead of a remote DOM traversal each
+            tree = lxml.html.fromstring(self.driver.page_source)
+
             # Look for result rows (PAPA often uses table rows for results)
-            result_rows = self.driver.find_elements(By.XPATH, "//tr[td[contains(@class, 'result') or contains(text(), 'PALM BEACH')]]")
-            if not result_rows:
+            row_xpath = "//tr[td[contains(@class, 'result') or contains(text(), 'PALM BEACH')]]"
+            if not tree.xpath(row_xpath):
                 # Broader search for data rows
-                result_rows = self.driver.find_elements(By.XPATH, "//tr[count(td) >= 3]")
-            
-            analysis['result_rows'] = result_rows
-            
-            # Look for property detail links
-            property_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'property') or contains(@href, 'parcel') or contains(@href, 'detail')]")
-            analysis['property_links'] = property_links
-            
-            # Check for pagination
-            pagination_indicators = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Next') or contains(text(), 'Page') or contains(@class, 'page')]")
-            analysis['pagination'] = len(pagination_indicators) > 0
+                row_xpath = "//tr[count(td) >= 3]"
+
+            # The rows branch drives execute_script with live elements, so
+            # fetch WebElements only for the XPath that actually matched
+            analysis['result_rows'] = (
+                self.driver.find_elements(By.XPATH, row_xpath)
+                if tree.xpath(row_xpath) else []
+            )
+
+            # Property detail links and pagination only feed counts/flags -
+            # the local tree answers both with no bridge traffic
+            analysis['property_links'] = tree.xpath(
+                "//a[contains(@href, 'property') or contains(@href, 'parcel') or contains(@href, 'detail')]")
+            analysis['pagination'] = bool(tree.xpath(
+                "//*[contains(text(), 'Next') or contains(text(), 'Page') or contains(@class, 'page')]"))
             
             # Determine structure type
             if analysis['tables']:
@@ -249,120 +462,207 @@ class EnhancedPropertyExtractor:
             return analysis
     
     def extract_from_papa_table(self, table_element) -> List[PropertyRecord]:
-        """Enhanced table extraction for PAPA results"""
+        """Enhanced table extraction for PAPA results.
+
+        Pulls the table's HTML in one WebDriver call and parses it locally
+        with BeautifulSoup/lxml - no per-row or per-cell round-trips to
+        chromedriver inside the loop.
+        """
+        try:
+            table_html = table_element.get_attribute('outerHTML')
+        except Exception as e:
+            self.logger.error(f"Error reading PAPA table HTML: {e}")
+            return []
+        return self._extract_from_table_html(table_html)
+
+    def _extract_from_table_html(self, table_html: str) -> List[PropertyRecord]:
+        """Parse one results table from raw HTML - pure local work, usable
+        off the WebDriver thread"""
         records = []
-        
+
         try:
-            rows = table_element.find_elements(By.TAG_NAME, "tr")
+            soup = BeautifulSoup(table_html, 'lxml')
+            rows = soup.find_all('tr')
             if len(rows) < 2:
                 return records
-            
+
             # Analyze headers with PAPA-specific mapping
             header_row = rows[0]
-            headers = []
-            
-            header_cells = header_row.find_elements(By.TAG_NAME, "th")
-            if not header_cells:
-                header_cells = header_row.find_elements(By.TAG_NAME, "td")
-            
-            for cell in header_cells:
-                headers.append(cell.text.strip().lower())
-            
+            header_cells = header_row.find_all('th') or header_row.find_all('td')
+            headers = [cell.get_text(strip=True).lower() for cell in header_cells]
+
             self.logger.debug(f"PAPA table headers: {headers}")
-            
+
             # Create enhanced PAPA column mapping
             column_mapping = self._create_papa_column_mapping(headers)
-            
-            # Extract data from rows
+
+            # Extract data from rows - single pass over the parsed tree
             for row_idx, row in enumerate(rows[1:], 1):
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
+                cells = row.find_all('td')
+
                 if len(cells) == 0:
                     continue
-                
+
                 record = PropertyRecord()
-                record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
+                record.extraction_date = self._run_ts
+
                 # Extract cell data
                 for col_idx, cell in enumerate(cells):
                     if col_idx < len(headers):
                         field_name = column_mapping.get(col_idx)
                         if field_name:
-                            cell_text = self._clean_papa_text(cell.text)
+                            cell_text = self._clean_papa_text(cell.get_text(strip=True))
                             setattr(record, field_name, cell_text)
-                
+
                 # Look for links to property details
-                links = row.find_elements(By.TAG_NAME, "a")
-                if links:
-                    record.record_url = links[0].get_attribute("href") or ""
-                
+                link = row.find('a', href=True)
+                if link:
+                    record.record_url = link['href']
+
                 # Extract additional info from the entire row
-                row_text = row.text
+                row_text = row.get_text(' ', strip=True)
                 self._extract_papa_patterns(row_text, record)
-                
+
                 # Only add records with meaningful data
                 if record.property_address or record.owner_name or record.parcel_number:
                     records.append(record)
-                    
+
                     if self.debug_mode:
                         self.logger.debug(f"Extracted PAPA row {row_idx}: {record.property_address[:50]}...")
-                
-                # Natural delay between row processing
-                if row_idx % 10 == 0:
-                    self.natural_delay(0.1, 0.3)
-            
+
             self.logger.info(f"✅ Extracted {len(records)} records from PAPA table")
             return records
-            
+
         except Exception as e:
             self.logger.error(f"Error extracting from PAPA table: {e}")
             return records
-    
+
+    def _http_session(self) -> requests.Session:
+        """Build (once) a requests session carrying the browser's cookies"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = (
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            )
+            if self.driver:
+                for cookie in self.driver.get_cookies():
+                    session.cookies.set(
+                        cookie['name'], cookie['value'], domain=cookie.get('domain')
+                    )
+            self._session = session
+        return self._session
+
+    _DETAIL_CACHE_MAX = 4096
+
+    def fetch_record_details(self, url: str) -> str:
+        """Fetch a record_url detail page, memoized per URL.
+
+        Duplicate parcels show up across result pages; the LRU keeps each
+        detail page to one network round-trip per run. Failures are not
+        cached so a later retry is possible.
+        """
+        if not url:
+            return ""
+
+        cache = self._detail_cache
+        if url in cache:
+            cache.move_to_end(url)
+            return cache[url]
+
+        try:
+            response = self._http_session().get(url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.debug(f"Detail fetch failed for {url}: {e}")
+            return ""
+
+        cache[url] = response.text
+        if len(cache) > self._DETAIL_CACHE_MAX:
+            cache.popitem(last=False)
+        return response.text
+
+    def extract_via_http(self, url: str) -> List[PropertyRecord]:
+        """Extract a server-rendered results page without the browser.
+
+        PAPA results pages are static HTML, so a plain HTTP fetch plus a
+        local lxml parse skips every WebDriver round-trip; the session is
+        seeded from the browser's cookies so the search context carries over.
+        Use this for follow-up pages; fall back to the Selenium path when a
+        page turns out to need JS rendering.
+        """
+        records = []
+
+        try:
+            response = self._http_session().get(url, timeout=30)
+            response.raise_for_status()
+            doc = lxml.html.fromstring(response.content)
+
+            # Any table with at least a header and one data row
+            for table in doc.xpath('//table[.//tr[2]]'):
+                table_html = lxml.html.tostring(table, encoding='unicode')
+                records.extend(self._extract_from_table_html(table_html))
+
+            self.logger.info(f"✅ HTTP extraction got {len(records)} records from {url}")
+        except Exception as e:
+            self.logger.error(f"HTTP extraction failed for {url}: {e}")
+
+        return self._remove_duplicates(records)
+
+    # PAPA header keywords per record field - inverted once at class build
+    # into _KEYWORD_TO_FIELD below
+    PAPA_FIELD_KEYWORDS = {
+        'property_address': ['address', 'location', 'street', 'site address', 'property location', 'situs'],
+        'owner_name': ['owner', 'name', 'taxpayer', 'owner name', 'taxpayer name'],
+        'mail_address': ['mailing', 'mail', 'mailing address', 'owner address'],
+        'mail_city_state_zip': ['mail city', 'mail state', 'mail zip', 'city state zip', 'owner city'],
+        'property_value': ['just value', 'market value', 'assessed', 'assessment', 'total value'],
+        'assessed_value': ['assessed', 'assessed value', 'assessment'],
+        'market_value': ['market', 'market value', 'fair market'],
+        'taxable_value': ['taxable', 'taxable value', 'net taxable'],
+        'square_footage': ['sqft', 'sq ft', 'square', 'footage', 'building area', 'living area'],
+        'lot_size': ['lot', 'land', 'lot size', 'lot sqft', 'land sqft', 'lot area'],
+        'acres': ['acres', 'acreage', 'acre'],
+        'parcel_number': ['parcel', 'pcn', 'parcel id', 'parcel number'],
+        'account_number': ['account', 'account number', 'acct'],
+        'folio_number': ['folio', 'folio number'],
+        'sale_price': ['sale', 'sold', 'price', 'sale price', 'last sale'],
+        'sale_date': ['date', 'sold date', 'sale date', 'last sale date'],
+        'year_built': ['year built', 'built', 'construction', 'year constructed'],
+        'property_type': ['type', 'property type', 'class'],
+        'property_use': ['use', 'land use', 'property use'],
+        'municipality': ['city', 'municipality', 'jurisdiction'],
+        'neighborhood': ['neighborhood', 'district', 'area'],
+        'subdivision': ['subdivision', 'subdiv', 'plat'],
+        'zoning': ['zone', 'zoning'],
+        'land_use_code': ['land use', 'use code', 'luc'],
+        'building_class': ['class', 'building class', 'bldg class'],
+        'bedrooms': ['bed', 'br', 'bedroom', 'bedrooms'],
+        'bathrooms': ['bath', 'bathroom', 'ba', 'full bath'],
+        'half_baths': ['half bath', 'half', 'powder'],
+        'tax_amount': ['tax', 'taxes', 'tax amount', 'annual tax'],
+        'homesteaded': ['homestead', 'homestead exempt', 'homesteaded'],
+        'exemption_amount': ['exempt', 'exemption', 'exempt amount']
+    }
+
+    # Flat keyword -> field list, longest keyword first so specific matches
+    # ("mail city") win over generic ones ("mail"); built once per process
+    _KEYWORD_TO_FIELD = sorted(
+        ((kw, field) for field, kws in PAPA_FIELD_KEYWORDS.items() for kw in kws),
+        key=lambda pair: -len(pair[0])
+    )
+
     def _create_papa_column_mapping(self, headers: List[str]) -> Dict[int, str]:
         """Create PAPA-specific column mapping"""
         mapping = {}
-        
-        papa_field_keywords = {
-            'property_address': ['address', 'location', 'street', 'site address', 'property location', 'situs'],
-            'owner_name': ['owner', 'name', 'taxpayer', 'owner name', 'taxpayer name'],
-            'mail_address': ['mailing', 'mail', 'mailing address', 'owner address'],
-            'mail_city_state_zip': ['mail city', 'mail state', 'mail zip', 'city state zip', 'owner city'],
-            'property_value': ['just value', 'market value', 'assessed', 'assessment', 'total value'],
-            'assessed_value': ['assessed', 'assessed value', 'assessment'],
-            'market_value': ['market', 'market value', 'fair market'],
-            'taxable_value': ['taxable', 'taxable value', 'net taxable'],
-            'square_footage': ['sqft', 'sq ft', 'square', 'footage', 'building area', 'living area'],
-            'lot_size': ['lot', 'land', 'lot size', 'lot sqft', 'land sqft', 'lot area'],
-            'acres': ['acres', 'acreage', 'acre'],
-            'parcel_number': ['parcel', 'pcn', 'parcel id', 'parcel number'],
-            'account_number': ['account', 'account number', 'acct'],
-            'folio_number': ['folio', 'folio number'],
-            'sale_price': ['sale', 'sold', 'price', 'sale price', 'last sale'],
-            'sale_date': ['date', 'sold date', 'sale date', 'last sale date'],
-            'year_built': ['year built', 'built', 'construction', 'year constructed'],
-            'property_type': ['type', 'property type', 'class'],
-            'property_use': ['use', 'land use', 'property use'],
-            'municipality': ['city', 'municipality', 'jurisdiction'],
-            'neighborhood': ['neighborhood', 'district', 'area'],
-            'subdivision': ['subdivision', 'subdiv', 'plat'],
-            'zoning': ['zone', 'zoning'],
-            'land_use_code': ['land use', 'use code', 'luc'],
-            'building_class': ['class', 'building class', 'bldg class'],
-            'bedrooms': ['bed', 'br', 'bedroom', 'bedrooms'],
-            'bathrooms': ['bath', 'bathroom', 'ba', 'full bath'],
-            'half_baths': ['half bath', 'half', 'powder'],
-            'tax_amount': ['tax', 'taxes', 'tax amount', 'annual tax'],
-            'homesteaded': ['homestead', 'homestead exempt', 'homesteaded'],
-            'exemption_amount': ['exempt', 'exemption', 'exempt amount']
-        }
-        
+
         for col_idx, header in enumerate(headers):
             header_lower = header.lower()
-            for field, keywords in papa_field_keywords.items():
-                if any(keyword in header_lower for keyword in keywords):
+            for keyword, field in self._KEYWORD_TO_FIELD:
+                if keyword in header_lower:
                     mapping[col_idx] = field
                     break
-        
+
         return mapping
     
     def _clean_papa_text(self, text: str) -> str:
@@ -371,11 +671,11 @@ class EnhancedPropertyExtractor:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
+        text = _WS_RE.sub(' ', text.strip())
+
         # Clean common PAPA formatting
-        text = re.sub(r'^[:\-\s]+|[:\-\s]+$', '', text)  # Remove leading/trailing punctuation
-        text = re.sub(r'\$\s*(\d)', r'$\1', text)  # Fix currency formatting
+        text = _TRIM_RE.sub('', text)  # Remove leading/trailing punctuation
+        text = _CURRENCY_RE.sub(r'$\1', text)  # Fix currency formatting
         
         return text
     
@@ -385,7 +685,7 @@ class EnhancedPropertyExtractor:
         # Check for compact format: "$100 2004-11-12 BACON JOHN D & 712 LAKESIDE CIR NORTH PALM BEACH 9068 712 LAKESIDE CIR NORTH PALM BEACH FL 33408 4523 Y QV MAP"
         # More flexible pattern to handle various formats
         compact_parts = text.strip().split()
-        if len(compact_parts) >= 10 and compact_parts[0].startswith('$') and re.match(r'\d{4}-\d{2}-\d{2}', compact_parts[1]):
+        if len(compact_parts) >= 10 and compact_parts[0].startswith('$') and _DATE_RE.match(compact_parts[1]):
             try:
                 # Parse the structured data
                 sale_price = compact_parts[0]
@@ -491,160 +791,163 @@ class EnhancedPropertyExtractor:
                 self.logger.debug(f"Error parsing compact format: {e}")
                 # Continue with regular patterns
         
-        # Property address patterns (PAPA specific)
-        if not record.property_address:
-            address_patterns = [
-                r'(\d+\s+[A-Z\s]+(?:ST|AVE|RD|DR|LN|CT|PL|WAY|BLVD|CIR)(?:\s+(?:APT|UNIT|STE)\s*[\w\d]+)?)',
-                r'(\d+\s+[A-Z][A-Z\s]+[A-Z](?:\s+(?:STREET|AVENUE|ROAD|DRIVE|LANE|COURT|PLACE|WAY|BOULEVARD|CIRCLE)))',
-            ]
-            
-            for pattern in address_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.property_address = match.group(1).strip()
-                    break
-        
-        # Parcel Number patterns (PAPA format: XX-XXXX-XXX-XXXX)
-        if not record.parcel_number:
-            parcel_patterns = [
-                r'([0-9]{2}-[0-9]{4}-[0-9]{3}-[0-9]{4})',
-                r'PCN[:\s]*([A-Z0-9\-]+)',
-                r'Parcel[:\s]*([A-Z0-9\-]+)'
-            ]
-            
-            for pattern in parcel_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.parcel_number = match.group(1)
-                    break
-        
-        # Value patterns with proper currency formatting
-        if not record.property_value:
-            value_patterns = [
-                r'Just Value[:\s]*\$([0-9,]+)',
-                r'Market Value[:\s]*\$([0-9,]+)',
-                r'Total Value[:\s]*\$([0-9,]+)'
-            ]
-            
-            for pattern in value_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.property_value = f"${match.group(1)}"
-                    break
-        
+        # Single fused scan: every field pattern lives in _MEGA_RE, so the
+        # row text is walked once instead of ~15 separate search passes.
+        # Matches are collected first-wins into a dict, then applied in one
+        # sweep - the record is only touched for fields that are still empty
+        updates = {}
+        for match in _MEGA_RE.finditer(text):
+            name = match.lastgroup
+            field = _MEGA_FIELDS[name]
+            if field in updates:
+                continue
+
+            value = match.group(name)
+            if field == 'property_value':
+                value = f"${value}"
+            elif field == 'homesteaded':
+                upper = value.upper()
+                if upper in ('YES', 'Y', 'HOMESTEAD EXEMPTION'):
+                    value = 'Yes'
+                elif upper in ('NO', 'N'):
+                    value = 'No'
+            elif field in ('property_address', 'mail_city_state_zip'):
+                value = value.strip()
+
+            updates[field] = value
+
+        for field, value in updates.items():
+            if not getattr(record, field):
+                setattr(record, field, value)
+
         # Municipality (should be Palm Beach)
         if not record.municipality:
             if "palm beach" in text.lower():
                 record.municipality = "Palm Beach"
-        
-        # Acres patterns
-        if not record.acres:
-            acres_patterns = [
-                r'([0-9]+\.?[0-9]*) acre[s]?',
-                r'Acres?[:\s]*([0-9]+\.?[0-9]*)',
-                r'([0-9]+\.?[0-9]*) ac'
-            ]
-            
-            for pattern in acres_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.acres = match.group(1)
-                    break
-        
-        # Mail City, State, Zip patterns
-        if not record.mail_city_state_zip:
-            mail_patterns = [
-                r'([A-Z\s]+,\s*[A-Z]{2}\s+[0-9]{5}(?:-[0-9]{4})?)',
-                r'Mail.*?([A-Z\s]+,\s*[A-Z]{2}\s+[0-9]{5})',
-                r'Owner.*?([A-Z\s]+,\s*FL\s+[0-9]{5})'
-            ]
-            
-            for pattern in mail_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.mail_city_state_zip = match.group(1).strip()
-                    break
-        
-        # Homesteaded patterns
-        if not record.homesteaded:
-            homestead_patterns = [
-                r'Homestead[:\s]*(Yes|No|Y|N)',
-                r'Homesteaded[:\s]*(Yes|No|Y|N)',
-                r'(Homestead Exemption)',
-                r'(Yes).*?homestead',
-                r'(No).*?homestead'
-            ]
-            
-            for pattern in homestead_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    value = match.group(1).upper()
-                    if value in ['YES', 'Y', 'HOMESTEAD EXEMPTION']:
-                        record.homesteaded = 'Yes'
-                    elif value in ['NO', 'N']:
-                        record.homesteaded = 'No'
-                    else:
-                        record.homesteaded = value
-                    break
-        
-        # Lot Size (additional to existing patterns)
-        if not record.lot_size:
-            lot_patterns = [
-                r'Lot Size[:\s]*([0-9,]+)\s*sq\s*ft',
-                r'Land Area[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*sq\s*ft\s*lot'
-            ]
-            
-            for pattern in lot_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    record.lot_size = match.group(1)
-                    break
     
-    def extract_all_papa_data(self) -> List[PropertyRecord]:
-        """Main extraction method for PAPA data"""
-        all_records = []
-        
+    def iter_papa_records(self) -> Iterator[PropertyRecord]:
+        """Stream records off the page as they are parsed.
+
+        Generator form of the extraction core: records are yielded as soon
+        as they carry meaningful data, so downstream consumers (dedupe,
+        CSV export) can process them without the whole result set in RAM.
+        """
+        self._run_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
         # Analyze page structure
         analysis = self.analyze_papa_page_structure()
-        
+
         # Try table extraction first (most common for PAPA)
         if analysis['structure_type'] == 'table':
-            for table_info in analysis['tables']:
-                self.logger.info(f"Processing PAPA table {table_info['index']} with {table_info['rows']} rows...")
-                records = self.extract_from_papa_table(table_info['element'])
-                all_records.extend(records)
-                self.natural_delay(0.5, 1.0)
-        
+            if len(analysis['tables']) > 1:
+                # Pull every table's HTML first (one WebDriver call each),
+                # then parse them in parallel - the parse work is pure
+                # Python/lxml with no driver access, so threads are safe
+                table_htmls = []
+                for table_info in analysis['tables']:
+                    self.logger.info(f"Fetching PAPA table {table_info['index']} with {table_info['rows']} rows...")
+                    try:
+                        table_htmls.append(table_info['element'].get_attribute('outerHTML'))
+                    except Exception as e:
+                        self.logger.error(f"Error reading table {table_info['index']}: {e}")
+
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    futures = [pool.submit(self._extract_from_table_html, html)
+                               for html in table_htmls]
+                    for future in as_completed(futures):
+                        yield from future.result()
+            else:
+                for table_info in analysis['tables']:
+                    self.logger.info(f"Processing PAPA table {table_info['index']} with {table_info['rows']} rows...")
+                    yield from self.extract_from_papa_table(table_info['element'])
+
         # Try row-based extraction
         elif analysis['structure_type'] == 'rows':
             self.logger.info(f"Processing {len(analysis['result_rows'])} result rows...")
-            for idx, row in enumerate(analysis['result_rows']):
+            # One execute_script call returns every row's text and first link;
+            # the old loop cost two round-trips (text + links) per row
+            row_data = self.driver.execute_script("""
+                return arguments[0].map(r => ({
+                    text: r.innerText,
+                    href: (r.querySelector('a') || {}).href || ''
+                }));
+            """, analysis['result_rows'])
+
+            for row in row_data:
                 record = PropertyRecord()
-                record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                row_text = row.text
-                self._extract_papa_patterns(row_text, record)
-                
-                # Get links
-                links = row.find_elements(By.TAG_NAME, "a")
-                if links:
-                    record.record_url = links[0].get_attribute("href") or ""
-                
+                record.extraction_date = self._run_ts
+
+                self._extract_papa_patterns(row['text'], record)
+                record.record_url = row['href']
+
                 if record.property_address or record.owner_name or record.parcel_number:
-                    all_records.append(record)
-                
-                if idx % 5 == 0:
-                    self.natural_delay(0.2, 0.5)
-        
+                    yield record
+
         # Fallback to text extraction
         else:
             self.logger.info("Using fallback text extraction...")
-            all_records = self._extract_from_papa_text()
-        
-        # Remove duplicates
-        unique_records = self._remove_duplicates(all_records)
-        
+            yield from self._extract_from_papa_text()
+
+    def _dedup_stream(self, records: Iterable[PropertyRecord]) -> Iterator[PropertyRecord]:
+        """Online duplicate filter - same tuple keys as _remove_duplicates"""
+        seen = set()
+        for record in records:
+            key = (
+                record.property_address.lower().strip(),
+                record.parcel_number.strip(),
+                record.owner_name.lower().strip()
+            )
+            if key not in seen and any(key):
+                seen.add(key)
+                yield record
+
+    def _enrich_from_detail_pages(self, records: List[PropertyRecord]) -> List[PropertyRecord]:
+        """Fill missing core fields from each record's detail page.
+
+        Fetches go through fetch_record_details, so duplicate parcels cost
+        one network round-trip per run; records that already carry all core
+        fields skip the network entirely.
+        """
+        core_fields = ('sale_price', 'owner_name', 'property_address', 'square_footage')
+        base_url = self.driver.current_url if self.driver else ''
+        enriched = 0
+
+        for record in records:
+            if not record.record_url:
+                continue
+            if all(getattr(record, field) for field in core_fields):
+                continue
+
+            detail_html = self.fetch_record_details(urljoin(base_url, record.record_url))
+            if not detail_html:
+                continue
+
+            doc = lxml.html.fromstring(detail_html)
+            for element in list(doc.iter('script', 'style')):
+                element.drop_tree()
+            self._extract_papa_patterns(doc.text_content(), record)
+            enriched += 1
+
+        if enriched:
+            self.logger.info(f"🔎 Enriched {enriched} records from detail pages")
+        return records
+
+    def extract_all_papa_data(self) -> List[PropertyRecord]:
+        """Main extraction method for PAPA data"""
+        # PAPA results pages are server-rendered, so try the browser-free
+        # fetch of the current URL first; it returns [] when the page needs
+        # JS rendering or the fetch fails, and the WebDriver walk takes over
+        unique_records = []
+        if self.driver is not None:
+            unique_records = self.extract_via_http(self.driver.current_url)
+
+        if not unique_records:
+            unique_records = list(self._dedup_stream(self.iter_papa_records()))
+
+        # Top up records whose detail links carry fields the results table
+        # didn't; the per-URL memoization keeps repeat parcels free
+        self._enrich_from_detail_pages(unique_records)
+
         self.logger.info(f"🎯 Total unique PAPA records extracted: {len(unique_records)}")
         return unique_records
     
@@ -654,30 +957,33 @@ class EnhancedPropertyExtractor:
         
         try:
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Remove scripts and styles
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text_content = soup.get_text()
-            
-            # Split by common PAPA separators
-            blocks = re.split(r'\n\s*\n|\t\t+|_{3,}|-{3,}', text_content)
-            
-            # Filter for property-like blocks
-            property_blocks = []
-            for block in blocks:
-                block = block.strip()
-                if len(block) > 50 and any(keyword in block.lower() for keyword in [
-                    'palm beach', 'parcel', 'property', 'owner', 'address', 'value'
-                ]):
-                    property_blocks.append(block)
+
+            if LexborHTMLParser is not None:
+                tree = LexborHTMLParser(page_source)
+                for tag in tree.css('script,style'):
+                    tag.decompose()
+                text_content = tree.body.text(separator='\n') if tree.body else ''
+            else:
+                soup = BeautifulSoup(page_source, 'lxml')
+
+                # Remove scripts and styles
+                for script in soup(["script", "style"]):
+                    script.decompose()
+
+                text_content = soup.get_text()
             
+            # Split by common PAPA separators and keep property-like blocks,
+            # all in one comprehension over precompiled patterns
+            property_blocks = [
+                stripped
+                for block in _BLOCK_SPLIT_RE.split(text_content)
+                if len(stripped := block.strip()) > 50 and _BLOCK_KEYWORDS_RE.search(stripped)
+            ]
+
             # Extract from blocks
             for idx, block in enumerate(property_blocks[:50]):
                 record = PropertyRecord()
-                record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                record.extraction_date = self._run_ts
                 record.additional_info = block[:300]
                 
                 self._extract_papa_patterns(block, record)
@@ -698,25 +1004,30 @@ class EnhancedPropertyExtractor:
         unique_records = []
         
         for record in records:
-            # Create unique key based on multiple fields
-            key_parts = [
+            # Tuple key hashes directly - no joined-string construction
+            key = (
                 record.property_address.lower().strip(),
                 record.parcel_number.strip(),
                 record.owner_name.lower().strip()
-            ]
-            key = "|".join(key_parts)
-            
-            if key not in seen and any(key_parts):
+            )
+
+            if key not in seen and any(key):
                 seen.add(key)
                 unique_records.append(record)
         
         return unique_records
     
-    def export_to_enhanced_csv(self, records: List[PropertyRecord], filename: str = None) -> str:
-        """Export to CSV with enhanced formatting"""
+    def export_to_enhanced_csv(self, records: Iterable[PropertyRecord], filename: str = None) -> str:
+        """Export to CSV with enhanced formatting.
+
+        Accepts any iterable of records and streams rows straight to disk -
+        nothing is materialized, so memory stays flat however large the
+        result set is.
+        """
         # Ensure extracted directory exists
-        os.makedirs('extracted', exist_ok=True)
-        
+        if not os.path.isdir('extracted'):
+            os.mkdir('extracted')
+
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"extracted/palm_beach_properties_enhanced_{timestamp}.csv"
@@ -724,76 +1035,41 @@ class EnhancedPropertyExtractor:
             # Ensure filename includes extracted folder
             if not filename.startswith('extracted/'):
                 filename = f"extracted/{filename}"
-        
+
         try:
-            with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:  # UTF-8 BOM for Excel
-                if not records:
+            # UTF-8 BOM for Excel; 1 MiB buffer so rows coalesce into large
+            # writes instead of one small syscall per row
+            with open(filename, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as csvfile:
+                # Plain csv.writer + the module-level attrgetter: one tuple
+                # per row, no per-record asdict() dict construction
+                writer = csv.writer(csvfile)
+
+                writer.writerow(_CSV_HEADER)
+
+                # Stream data rows through writerows so the row loop runs in
+                # C; keep the first couple of records for the sample view
+                count = 0
+                samples = []
+
+                def rows():
+                    nonlocal count
+                    for record in records:
+                        count += 1
+                        if len(samples) < 2:
+                            samples.append(record)
+                        yield _CSV_GET(record)
+
+                writer.writerows(rows())
+
+                if count == 0:
                     self.logger.warning("⚠️  No records to export")
                     return filename
-                
-                # Define field order with required fields first
-                field_order = [
-                    'parcel_number', 'sale_price', 'sale_date', 'owner_name',
-                    'property_address', 'municipality', 'square_footage',
-                    'mail_address', 'mail_city_state_zip', 'homesteaded',
-                    'acres', 'lot_size', 'zoning',
-                    'property_value', 'assessed_value', 'market_value', 'taxable_value',
-                    'year_built', 'bedrooms', 'bathrooms', 'half_baths',
-                    'property_type', 'property_use', 'building_class',
-                    'account_number', 'folio_number', 'deed_book',
-                    'neighborhood', 'subdivision', 'land_use_code', 'school_district',
-                    'tax_amount', 'exemption_amount',
-                    'record_url', 'additional_info', 'extraction_date'
-                ]
-                
-                writer = csv.DictWriter(csvfile, fieldnames=field_order)
-                
-                # Write header with friendly names
-                friendly_headers = {
-                    'property_address': 'Property Address',
-                    'owner_name': 'Owner Name',
-                    'property_value': 'Property Value',
-                    'assessed_value': 'Assessed Value',
-                    'market_value': 'Market Value',
-                    'taxable_value': 'Taxable Value',
-                    'square_footage': 'Square Footage',
-                    'year_built': 'Year Built',
-                    'bedrooms': 'Bedrooms',
-                    'bathrooms': 'Bathrooms',
-                    'half_baths': 'Half Baths',
-                    'property_type': 'Property Type',
-                    'property_use': 'Property Use',
-                    'building_class': 'Building Class',
-                    'account_number': 'Account Number',
-                    'folio_number': 'Folio Number',
-                    'sale_price': 'Sale Price',
-                    'sale_date': 'Sale Date',
-                    'deed_book': 'Deed Book',
-                    'municipality': 'Municipality',
-                    'neighborhood': 'Neighborhood',
-                    'subdivision': 'Subdivision',
-                    'zoning': 'Zoning',
-                    'land_use_code': 'Land Use Code',
-                    'school_district': 'School District',
-                    'tax_amount': 'Tax Amount',
-                    'exemption_amount': 'Exemption Amount',
-                    'record_url': 'Record URL',
-                    'additional_info': 'Additional Info',
-                    'extraction_date': 'Extraction Date'
-                }
-                
-                writer.writerow(friendly_headers)
-                
-                # Write data
-                for record in records:
-                    record_dict = asdict(record)
-                    writer.writerow(record_dict)
-                
-                self.logger.info(f"✅ Successfully exported {len(records)} records to {filename}")
-                
+
+                self.logger.info(f"✅ Successfully exported {count} records to {filename}")
+
                 # Show sample data
-                self._show_enhanced_sample_data(records)
-                
+                self._show_enhanced_sample_data(samples)
+
                 return filename
                 
         except Exception as e:
@@ -802,43 +1078,80 @@ class EnhancedPropertyExtractor:
     
     def _show_enhanced_sample_data(self, records: List[PropertyRecord], num_samples: int = 2):
         """Show enhanced sample of extracted data"""
-        print(f"\n📋 Sample of extracted PAPA data (showing {min(num_samples, len(records))} records):")
-        print("="*100)
-        
+        # Assemble the whole sample view as one string and emit it with a
+        # single write - one stdout lock/flush instead of ~15 print calls
+        lines = [
+            f"\n📋 Sample of extracted PAPA data (showing {min(num_samples, len(records))} records):",
+            "=" * 100,
+        ]
+
         for i, record in enumerate(records[:num_samples]):
-            print(f"\n🏠 Property Record {i+1}:")
-            print("-" * 50)
-            
-            # Show key fields in logical order
-            key_fields = [
-                ('Property Address', record.property_address),
-                ('Owner Name', record.owner_name),
-                ('Property Value', record.property_value),
-                ('Square Footage', record.square_footage),
-                ('Municipality', record.municipality),
-                ('Year Built', record.year_built),
-                ('Sale Price', record.sale_price),
-                ('Sale Date', record.sale_date)
-            ]
-            
-            for field_name, field_value in key_fields:
-                if field_value and field_value.strip():
-                    print(f"   {field_name:18}: {field_value}")
-            
+            lines.append(f"\n🏠 Property Record {i+1}:")
+            lines.append("-" * 50)
+
+            # Key fields in logical order - one attrgetter call per record
+            lines.extend(
+                f"   {field_name:18}: {field_value}"
+                for field_name, field_value in zip(_SAMPLE_LABELS, _SAMPLE_GET(record))
+                if field_value and field_value.strip()
+            )
+
             if record.record_url:
-                print(f"   {'Record URL':18}: {record.record_url[:60]}...")
-        
-        print("\n" + "="*100)
-    
+                lines.append(f"   {'Record URL':18}: {record.record_url[:60]}...")
+
+        lines.append("\n" + "=" * 100)
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    def _write_json_backup(self, records: List[PropertyRecord], json_file: str):
+        """Stream the JSON Lines backup file for a finished extraction"""
+        # One record per line keeps memory flat - no full dict-list is ever
+        # materialized - and the backup stays trivially greppable
+        with open(json_file, 'wb', buffering=1 << 20) as f:
+            if orjson is not None:
+                # orjson serializes the dataclasses directly - no asdict
+                # deep-copy per record, and the dump itself runs in Rust
+                f.writelines(orjson.dumps(record) + b'\n' for record in records)
+            else:
+                f.writelines(
+                    json.dumps(_record_to_dict(record), ensure_ascii=False).encode('utf-8') + b'\n'
+                    for record in records
+                )
+
+    # DevTools endpoint of the search script's Chrome, with a short retry
+    # schedule: the usual connect failure is a race against that script
+    # still booting its browser, and a sub-second wait beats launching a
+    # second Chrome (~2s startup, ~150MB)
+    _DEBUG_ADDRESS = "127.0.0.1:9222"
+    _CONNECT_BACKOFF = (0.2, 0.5, 1.0)
+
+    def _debug_port_reachable(self) -> bool:
+        """Probe the DevTools endpoint, backing off briefly between tries"""
+        for delay in self._CONNECT_BACKOFF:
+            try:
+                requests.get(
+                    f"http://{self._DEBUG_ADDRESS}/json/version", timeout=0.5
+                )
+                return True
+            except requests.RequestException:
+                time.sleep(delay)
+        return False
+
     def connect_to_search_session(self) -> bool:
         """Connect to the existing search browser session"""
         try:
             print("🔗 Attempting to connect to existing browser session...")
-            
+
+            # Cheap HTTP probe first - don't pay for a WebDriver session
+            # attempt against a port that isn't listening yet
+            if not self._debug_port_reachable():
+                print("❌ Debug port not reachable after retries")
+                print("Make sure the search script (pbc_property_search.py) is still running!")
+                return False
+
             # Connect to the Chrome session started by the search script
             chrome_options = Options()
-            chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
-            
+            chrome_options.add_experimental_option("debuggerAddress", self._DEBUG_ADDRESS)
+
             self.driver = webdriver.Chrome(options=chrome_options)
             self.wait = WebDriverWait(self.driver, 10)
             
@@ -893,15 +1206,15 @@ class EnhancedPropertyExtractor:
                 print("   - Try scrolling to ensure all results are loaded")
                 return None
             
-            # Export to enhanced CSV
-            csv_file = self.export_to_enhanced_csv(records)
-            
-            # Also export to JSON for backup
+            # CSV export and JSON backup are independent file writes - issue
+            # them together so one flushes while the other is still writing
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            json_file = f"extracted/palm_beach_properties_enhanced_{timestamp}.json"
-            with open(json_file, 'w', encoding='utf-8') as f:
-                data = [asdict(record) for record in records]
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            json_file = f"extracted/palm_beach_properties_enhanced_{timestamp}.jsonl"
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                csv_future = pool.submit(self.export_to_enhanced_csv, records)
+                json_future = pool.submit(self._write_json_backup, records, json_file)
+                csv_file = csv_future.result()
+                json_future.result()
             
             print(f"\n🎉 Enhanced extraction completed successfully!")
             print(f"📊 Total records extracted: {len(records)}")
@@ -922,11 +1235,19 @@ class EnhancedPropertyExtractor:
             return None
         
         finally:
-            # Keep browser open for review
             if self.driver:
-                print("\n⏳ Keeping browser open for 30 seconds for review...")
                 try:
-                    time.sleep(30)
+                    if self.debug_mode:
+                        # Review pause only when debugging: wait until the
+                        # user closes the window, capped at 30s, instead of
+                        # always sleeping out the full 30
+                        print("\n⏳ Keeping browser open for review (close the window to finish, max 30s)...")
+                        try:
+                            WebDriverWait(self.driver, 30).until(
+                                lambda d: not d.window_handles
+                            )
+                        except TimeoutException:
+                            pass
                     self.driver.quit()
                 except:
                     pass
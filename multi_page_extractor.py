@@ -1,849 +1,964 @@
-#!/usr/bin/env python3
-"""
-Multi-Page Property Extractor for Palm Beach County Property Appraiser
-
-This script automatically:
-1. Connects to existing browser session from pbc_property_search.py
-2. Extracts data from current page
-3. Navigates to next page every 8 seconds
-4. Combines all data into one large CSV file
-5. Continues until no more pages are found
-"""
-
-import time
-import csv
-import json
-import logging
-from datetime import datetime
-from typing import List, Dict, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from dataclasses import dataclass, asdict
-import os
-
-@dataclass
-class PropertyRecord:
-    """PAPA GetSalesSearch results structure - matching exact page layout"""
-    # Core fields in exact order from GetSalesSearch page
-    sale_price: str = ""           # Sale Price (first priority field)
-    sale_date: str = ""            # Sale Date 
-    owner_name: str = ""           # Owner Name
-    property_address: str = ""     # Location/Property Address
-    municipality: str = ""         # Municipality
-    square_footage: str = ""       # Sq. Ft
-    mail_address: str = ""         # Mail Address
-    mail_city_state_zip: str = ""  # Mail City, State, Zip
-    homesteaded: str = ""          # Homestead status
-    
-    # Additional useful fields (secondary priority)
-    parcel_number: str = ""        # Parcel/Account Number
-    property_value: str = ""       # Assessed/Market Value
-    lot_size: str = ""            # Lot Size
-    year_built: str = ""          # Year Built
-    property_type: str = ""       # Property Type
-    
-    # Meta fields
-    record_url: str = ""          # Link to detailed record
-    extraction_date: str = ""     # When extracted
-    page_number: int = 0          # Which results page
-
-class MultiPageExtractor:
-    def __init__(self, debug_mode: bool = True):
-        self.debug_mode = debug_mode
-        self.driver = None
-        self.logger = self.setup_logging()
-        self.all_records = []
-        self.total_pages = None
-        self.current_page = 1
-        
-    def setup_logging(self):
-        """Setup logging configuration"""
-        log_filename = f"multi_page_extractor_{datetime.now().strftime('%Y%m%d')}.log"
-        log_path = os.path.join("extracted", log_filename)
-        
-        # Create extracted directory if it doesn't exist
-        os.makedirs("extracted", exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO if self.debug_mode else logging.WARNING,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_path),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
-
-    def connect_to_browser(self) -> bool:
-        """Connect to existing browser session"""
-        try:
-            print("🔗 Connecting to existing Chrome browser session...")
-            chrome_options = Options()
-            chrome_options.add_experimental_option("debuggerAddress", "localhost:9222")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            
-            current_url = self.driver.current_url
-            page_title = self.driver.title
-            
-            print(f"✅ Connected to browser successfully!")
-            print(f"   Current page: {page_title}")
-            print(f"   URL: {current_url}")
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to connect to browser: {e}")
-            print(f"❌ Failed to connect to browser session: {e}")
-            print("Make sure you ran 'python3 pbc_property_search.py' first and browser is still open")
-            return False
-
-    def wait_for_page_load(self, timeout: int = 10) -> bool:
-        """Wait for page to fully load"""
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(2)  # Additional buffer
-            return True
-        except TimeoutException:
-            self.logger.warning(f"Page load timeout after {timeout} seconds")
-            return False
-
-    def detect_total_pages(self) -> int:
-        """Detect total number of pages from pagination controls"""
-        try:
-            print("🔍 Detecting total number of pages...")
-            
-            # Common pagination patterns to find total pages
-            total_page_patterns = [
-                # "Page 1 of 15" format
-                "//text()[contains(., 'Page') and contains(., 'of')]",
-                "//span[contains(text(), 'of') and contains(text(), 'Page')]",
-                "//div[contains(text(), 'of') and contains(text(), 'Page')]",
-                
-                # "1 of 15" or "1/15" format
-                "//text()[contains(., 'of ') and preceding-sibling::*[contains(., '1')]]",
-                "//*[contains(text(), 'of ') and contains(text(), '/')]",
-                
-                # Last page number in pagination
-                "//*[contains(@class, 'pagination')]//a[last()]",
-                "//*[contains(@class, 'pager')]//a[last()]",
-                "//*[contains(@id, 'pagination')]//a[last()]",
-                
-                # Look for highest numbered page link
-                "//a[contains(@href, 'page') or contains(@href, 'Page')]",
-                "//a[text() and string-length(text()) <= 3 and translate(text(), '0123456789', '') = '']"
-            ]
-            
-            max_pages_found = 0
-            
-            # Try text-based detection first
-            for pattern in total_page_patterns[:5]:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    for element in elements:
-                        text = element.text if hasattr(element, 'text') else str(element)
-                        
-                        # Look for "Page X of Y" or "X of Y" patterns
-                        import re
-                        matches = re.findall(r'(?:Page\s+)?(\d+)\s+of\s+(\d+)', text, re.IGNORECASE)
-                        if matches:
-                            total = int(matches[0][1])
-                            current = int(matches[0][0])
-                            print(f"   Found pagination text: '{text}' -> Total pages: {total}")
-                            self.current_page = current
-                            return total
-                            
-                        # Look for "X/Y" format
-                        matches = re.findall(r'(\d+)\s*/\s*(\d+)', text)
-                        if matches:
-                            total = int(matches[0][1])
-                            current = int(matches[0][0])
-                            print(f"   Found pagination text: '{text}' -> Total pages: {total}")
-                            self.current_page = current
-                            return total
-                            
-                except Exception as e:
-                    continue
-            
-            # Try numbered page links detection
-            print("   Trying numbered page links detection...")
-            try:
-                page_links = self.driver.find_elements(By.XPATH, "//a[text() and string-length(text()) <= 3 and translate(text(), '0123456789', '') = '']")
-                page_numbers = []
-                
-                for link in page_links:
-                    try:
-                        page_num = int(link.text.strip())
-                        if 1 <= page_num <= 1000:  # Reasonable range
-                            page_numbers.append(page_num)
-                    except (ValueError, AttributeError):
-                        continue
-                
-                if page_numbers:
-                    max_pages_found = max(page_numbers)
-                    print(f"   Found page numbers: {sorted(set(page_numbers))} -> Max page: {max_pages_found}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error detecting page numbers: {e}")
-            
-            # Try pagination container analysis
-            print("   Trying pagination container analysis...")
-            try:
-                pagination_containers = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'pagination') or contains(@class, 'pager') or contains(@id, 'pagination')]")
-                
-                for container in pagination_containers:
-                    # Look for any numbers in the container
-                    container_text = container.text
-                    numbers = re.findall(r'\b(\d+)\b', container_text)
-                    if numbers:
-                        # Take the largest reasonable number as potential max page
-                        largest_num = max([int(n) for n in numbers if 1 <= int(n) <= 1000])
-                        if largest_num > max_pages_found:
-                            max_pages_found = largest_num
-                            print(f"   Found in pagination container: {container_text} -> Potential max page: {largest_num}")
-                            
-            except Exception as e:
-                self.logger.error(f"Error analyzing pagination containers: {e}")
-            
-            # Final fallback - look for any "next" or "last" indicators
-            if max_pages_found == 0:
-                print("   No specific page count found, will detect dynamically during navigation")
-                return None
-            
-            print(f"✅ Detected total pages: {max_pages_found}")
-            return max_pages_found
-            
-        except Exception as e:
-            self.logger.error(f"Error detecting total pages: {e}")
-            print(f"⚠️ Could not detect total pages: {e}")
-            return None
-
-    def get_current_page_number(self) -> int:
-        """Try to detect current page number from the page"""
-        try:
-            # Look for current page indicators
-            patterns = [
-                "//span[contains(@class, 'current') or contains(@class, 'active')]",
-                "//a[contains(@class, 'current') or contains(@class, 'active')]",
-                "//li[contains(@class, 'current') or contains(@class, 'active')]//a",
-                "//*[contains(@class, 'pagination')]//*[contains(@class, 'current') or contains(@class, 'active')]"
-            ]
-            
-            for pattern in patterns:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text.isdigit() and 1 <= int(text) <= 1000:
-                            return int(text)
-                except:
-                    continue
-                    
-            return self.current_page  # Fallback to tracked page
-            
-        except Exception as e:
-            self.logger.error(f"Error detecting current page: {e}")
-            return self.current_page
-
-    def extract_current_page_data(self, page_number: int) -> List[PropertyRecord]:
-        """Extract property data from current page"""
-        print(f"📄 Extracting data from page {page_number}...")
-        records = []
-        
-        try:
-            # Wait for page to load
-            self.wait_for_page_load()
-            
-            # Look for common table structures first
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
-            
-            if tables:
-                print(f"   Found {len(tables)} tables on page")
-                for table_idx, table in enumerate(tables):
-                    table_records = self.extract_from_table(table, page_number)
-                    records.extend(table_records)
-                    print(f"   Table {table_idx + 1}: {len(table_records)} records")
-            
-            # If no tables, look for result rows/divs
-            if not records:
-                result_rows = self.find_result_rows()
-                if result_rows:
-                    print(f"   Found {len(result_rows)} result rows")
-                    records = self.extract_from_rows(result_rows, page_number)
-                    
-            # Fallback to text extraction
-            if not records:
-                print("   Using fallback text extraction...")
-                records = self.extract_from_text(page_number)
-            
-            print(f"✅ Extracted {len(records)} records from page {page_number}")
-            return records
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting data from page {page_number}: {e}")
-            print(f"❌ Error on page {page_number}: {e}")
-            return []
-
-    def extract_from_table(self, table, page_number: int) -> List[PropertyRecord]:
-        """Extract data from GetSalesSearch results table with proper field mapping"""
-        records = []
-        
-        try:
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            
-            # Get header row to understand column structure
-            header_row = None
-            if rows:
-                header_cells = rows[0].find_elements(By.TAG_NAME, "th")
-                if not header_cells:  # Try td for headers
-                    header_cells = rows[0].find_elements(By.TAG_NAME, "td")
-                
-                if header_cells:
-                    header_row = [cell.text.strip().lower() for cell in header_cells]
-                    print(f"   📋 Table headers detected: {header_row}")
-            
-            # Process data rows (skip header)
-            data_rows = rows[1:] if len(rows) > 1 else rows
-            
-            for row_idx, row in enumerate(data_rows):
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
-                if len(cells) < 3:  # Skip rows with too few cells
-                    continue
-                
-                record = PropertyRecord()
-                record.page_number = page_number
-                record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Extract text from each cell
-                cell_texts = [cell.text.strip() for cell in cells]
-                
-                # Map fields based on GetSalesSearch typical column order
-                # Common GetSalesSearch columns: Sale Price, Sale Date, Owner, Address, Municipality, etc.
-                
-                if header_row:
-                    # Use header-based mapping
-                    for i, (header, text) in enumerate(zip(header_row, cell_texts)):
-                        if not text:
-                            continue
-                            
-                        # Map based on header content
-                        if any(keyword in header for keyword in ['sale', 'price']) and '$' in text:
-                            record.sale_price = text
-                        elif any(keyword in header for keyword in ['sale', 'date']) and ('/' in text or '-' in text):
-                            record.sale_date = text
-                        elif any(keyword in header for keyword in ['owner', 'name', 'taxpayer']):
-                            record.owner_name = text
-                        elif any(keyword in header for keyword in ['address', 'location', 'property']):
-                            record.property_address = text
-                        elif any(keyword in header for keyword in ['municipality', 'city']):
-                            record.municipality = text
-                        elif any(keyword in header for keyword in ['sq', 'sqft', 'footage']):
-                            record.square_footage = text
-                        elif any(keyword in header for keyword in ['mail', 'mailing']) and 'address' in header:
-                            record.mail_address = text
-                        elif any(keyword in header for keyword in ['mail']) and any(k in header for k in ['city', 'state', 'zip']):
-                            record.mail_city_state_zip = text
-                        elif any(keyword in header for keyword in ['homestead']):
-                            record.homesteaded = text
-                        elif any(keyword in header for keyword in ['parcel', 'account']):
-                            record.parcel_number = text
-                
-                else:
-                    # Fallback: position-based mapping (common GetSalesSearch order)
-                    print(f"   ⚠️ No headers found, using position-based mapping")
-                    
-                    for i, text in enumerate(cell_texts):
-                        if not text:
-                            continue
-                        
-                        # Position-based field assignment for typical GetSalesSearch layout
-                        if i == 0:  # First column often sale price
-                            if '$' in text:
-                                record.sale_price = text
-                            elif any(c.isdigit() for c in text):
-                                record.parcel_number = text  # Sometimes parcel is first
-                        elif i == 1:  # Second column often sale date
-                            if '/' in text or '-' in text or any(month in text.lower() for month in ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
-                                record.sale_date = text
-                            elif '$' in text and not record.sale_price:
-                                record.sale_price = text
-                        elif i == 2:  # Third column often owner name
-                            if (len(text) > 3 and 
-                                not text.replace(' ', '').replace(',', '').replace('.', '').isdigit() and
-                                not any(keyword in text.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR', 'WAY', 'PL'])):
-                                record.owner_name = text
-                        elif i == 3:  # Fourth column often property address
-                            if any(keyword in text.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR', 'WAY', 'PL']):
-                                record.property_address = text
-                        elif i == 4:  # Fifth column often municipality
-                            if len(text) > 2 and text.replace(' ', '').isalpha():
-                                record.municipality = text
-                        elif i == 5:  # Sixth column might be square footage
-                            if text.replace(',', '').replace('.', '').isdigit():
-                                record.square_footage = text
-                
-                # Additional pattern-based extraction for missed fields
-                for i, text in enumerate(cell_texts):
-                    if not text:
-                        continue
-                    
-                    # Sale Price - look for $ amounts
-                    if '$' in text and not record.sale_price:
-                        record.sale_price = text
-                    
-                    # Owner Name - aggressive name detection
-                    elif (not record.owner_name and 
-                          len(text) > 3 and
-                          not '$' in text and
-                          not text.replace(',', '').replace('.', '').isdigit() and
-                          not any(keyword in text.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR', 'WAY', 'PL']) and
-                          not any(city in text.upper() for city in ['PALM BEACH', 'WEST PALM', 'BOCA', 'DELRAY', 'BOYNTON', 'WELLINGTON', 'JUPITER'])):
-                        # Check if it has characteristics of a person's name
-                        words = text.split()
-                        if (len(words) >= 1 and 
-                            all(word.replace(',', '').replace('.', '').isalpha() for word in words) and
-                            any(word[0].isupper() for word in words if word)):  # At least one capitalized word
-                            record.owner_name = text.strip()
-                    
-                    # Property Address - look for street indicators
-                    elif any(keyword in text.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR', 'WAY', 'PL']) and not record.property_address:
-                        record.property_address = text
-                    
-                    # Municipality - look for city names (alphabetic, 2+ words or known cities)
-                    elif (text.replace(' ', '').replace('-', '').isalpha() and 
-                          len(text) > 2 and 
-                          not record.municipality and 
-                          text != record.owner_name and  # Don't confuse with owner name
-                          not any(keyword in text.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR'])):
-                        # Check if it looks like a city name
-                        if ' ' in text or any(city in text.upper() for city in ['PALM BEACH', 'WEST PALM', 'BOCA', 'DELRAY', 'BOYNTON']):
-                            record.municipality = text
-                    
-                    # Square footage - numeric values that could be sq ft
-                    elif (text.replace(',', '').replace('.', '').isdigit() and 
-                          500 <= int(text.replace(',', '')) <= 50000 and 
-                          not record.square_footage):
-                        record.square_footage = text
-                
-                # Get links from the row
-                links = row.find_elements(By.TAG_NAME, "a")
-                if links:
-                    record.record_url = links[0].get_attribute("href") or ""
-                
-                # Debug: Show what we extracted for this row
-                if self.debug_mode:
-                    print(f"   🔍 Row {row_idx + 1} debug:")
-                    print(f"      Raw cells: {cell_texts}")
-                    print(f"      Sale Price: '{record.sale_price}'")
-                    print(f"      Owner Name: '{record.owner_name}'")
-                    print(f"      Address: '{record.property_address}'")
-                    print(f"      Municipality: '{record.municipality}'")
-                
-                # Only add record if it has core data
-                if (record.sale_price or record.property_address or record.owner_name or 
-                    record.municipality or record.parcel_number):
-                    records.append(record)
-                    print(f"   ✓ Row {row_idx + 1}: ${record.sale_price} | {record.owner_name} | {record.property_address}")
-                else:
-                    print(f"   ⚠️ Row {row_idx + 1}: Insufficient data, skipped")
-                    if self.debug_mode:
-                        print(f"      Available data: {[text for text in cell_texts if text]}")
-                        
-        except Exception as e:
-            self.logger.error(f"Error extracting from table: {e}")
-            print(f"   ❌ Table extraction error: {e}")
-            
-        return records
-
-    def find_result_rows(self):
-        """Find result rows using various patterns"""
-        selectors = [
-            "div[class*='result']",
-            "tr[class*='result']",
-            "div[class*='property']",
-            "div[class*='record']",
-            ".search-result",
-            ".property-result",
-            "[id*='result']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and len(elements) > 1:  # Found multiple results
-                    return elements
-            except:
-                continue
-                
-        return []
-
-    def extract_from_rows(self, rows, page_number: int) -> List[PropertyRecord]:
-        """Extract data from result rows/divs with proper field mapping"""
-        records = []
-        
-        for row_idx, row in enumerate(rows):
-            try:
-                record = PropertyRecord()
-                record.page_number = page_number
-                record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                row_text = row.text
-                self.extract_patterns_from_text(row_text, record)
-                
-                # Get links
-                links = row.find_elements(By.TAG_NAME, "a")
-                if links:
-                    record.record_url = links[0].get_attribute("href") or ""
-                
-                # Only add if we have meaningful data
-                if (record.sale_price or record.property_address or record.owner_name or 
-                    record.municipality or record.parcel_number):
-                    records.append(record)
-                    print(f"   ✓ Row {row_idx + 1}: ${record.sale_price} | {record.owner_name} | {record.property_address}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing row: {e}")
-                continue
-                
-        return records
-
-    def extract_from_text(self, page_number: int) -> List[PropertyRecord]:
-        """Fallback text extraction method"""
-        try:
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Split into potential records (basic heuristic)
-            lines = page_text.split('\n')
-            records = []
-            current_record = PropertyRecord()
-            current_record.page_number = page_number
-            current_record.extraction_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            for line in lines:
-                line = line.strip()
-                if line:
-                    self.extract_patterns_from_text(line, current_record)
-            
-            if current_record.property_address or current_record.owner_name:
-                records.append(current_record)
-                
-            return records
-            
-        except Exception as e:
-            self.logger.error(f"Error in text extraction: {e}")
-            return []
-
-    def extract_patterns_from_text(self, text: str, record: PropertyRecord):
-        """Extract GetSalesSearch-specific patterns from text"""
-        import re
-        
-        # Sale Price - look for dollar amounts (prioritize sale price)
-        dollar_pattern = r'\$[\d,]+\.?\d*'
-        dollar_matches = re.findall(dollar_pattern, text)
-        if dollar_matches and not record.sale_price:
-            record.sale_price = dollar_matches[0]  # First dollar amount is likely sale price
-        
-        # Sale Date - various date formats
-        date_patterns = [
-            r'\b\d{1,2}/\d{1,2}/\d{4}\b',          # MM/DD/YYYY
-            r'\b\d{1,2}-\d{1,2}-\d{4}\b',          # MM-DD-YYYY  
-            r'\b\d{4}-\d{1,2}-\d{1,2}\b',          # YYYY-MM-DD
-            r'\b[A-Za-z]{3}\s+\d{1,2},?\s+\d{4}\b' # Jan 15, 2024
-        ]
-        
-        if not record.sale_date:
-            for pattern in date_patterns:
-                date_match = re.search(pattern, text)
-                if date_match:
-                    record.sale_date = date_match.group().strip()
-                    break
-        
-        # Property Address - street address patterns
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(St|Street|Ave|Avenue|Blvd|Boulevard|Rd|Road|Ln|Lane|Ct|Court|Dr|Drive|Way|Pl|Place)\b',
-            r'\b\d+\s+[A-Z][A-Za-z\s]+\s+(ST|AVE|BLVD|RD|LN|CT|DR|WAY|PL)\b'
-        ]
-        
-        if not record.property_address:
-            for pattern in address_patterns:
-                address_match = re.search(pattern, text, re.IGNORECASE)
-                if address_match:
-                    record.property_address = address_match.group().strip()
-                    break
-        
-        # Owner Name - multiple patterns for better detection
-        if not record.owner_name:
-            # Pattern 1: Last, First format
-            name_pattern1 = r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'
-            name_match1 = re.search(name_pattern1, text)
-            if name_match1:
-                record.owner_name = name_match1.group().strip()
-            else:
-                # Pattern 2: First Last format (2+ words, proper case)
-                name_pattern2 = r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'
-                name_matches2 = re.findall(name_pattern2, text)
-                for name in name_matches2:
-                    # Skip if it looks like an address, municipality, or other non-name
-                    if (not any(keyword in name.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR', 'WAY', 'PL']) and
-                        not any(city in name.upper() for city in ['PALM BEACH', 'WEST PALM', 'BOCA RATON', 'DELRAY BEACH', 'BOYNTON BEACH', 'WELLINGTON', 'JUPITER']) and
-                        name.strip() != record.property_address and
-                        name.strip() != record.municipality and
-                        len(name.strip()) > 3):
-                        record.owner_name = name.strip()
-                        break
-                
-                # Pattern 3: Single capitalized word (less preferred but sometimes needed)
-                if not record.owner_name:
-                    name_pattern3 = r'\b[A-Z][A-Z\s]+[A-Z]\b'  # ALL CAPS names
-                    name_match3 = re.search(name_pattern3, text)
-                    if (name_match3 and 
-                        len(name_match3.group().strip()) > 3 and
-                        not any(keyword in name_match3.group().upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR'])):
-                        record.owner_name = name_match3.group().strip()
-        
-        # Municipality - city names (alphabetic, often multiple words)
-        municipality_patterns = [
-            r'\b(Palm Beach|West Palm Beach|Boca Raton|Delray Beach|Boynton Beach|Wellington|Jupiter|Lake Worth)\b',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'  # General capitalized words
-        ]
-        
-        if not record.municipality:
-            for pattern in municipality_patterns:
-                muni_matches = re.findall(pattern, text, re.IGNORECASE)
-                for muni in muni_matches:
-                    # Skip addresses, owner names already captured, and small words
-                    if (not any(keyword in muni.upper() for keyword in ['ST', 'AVE', 'BLVD', 'RD', 'LN', 'CT', 'DR']) and
-                        muni != record.owner_name and
-                        muni != record.property_address and
-                        len(muni) > 2):
-                        record.municipality = muni.strip()
-                        break
-                if record.municipality:
-                    break
-        
-        # Square Footage - numeric values in reasonable range
-        sqft_pattern = r'\b([1-9]\d{2,4})\b'  # 100-99999 range
-        if not record.square_footage:
-            sqft_matches = re.findall(sqft_pattern, text)
-            for sqft in sqft_matches:
-                sqft_num = int(sqft)
-                if 500 <= sqft_num <= 50000:  # Reasonable house size range
-                    record.square_footage = sqft
-                    break
-        
-        # Parcel/Account numbers - alphanumeric with dashes
-        parcel_patterns = [
-            r'\b[A-Z0-9]{2,3}-[0-9]{2,4}-[0-9]{2,4}\b',  # XX-XXXX-XXXX format
-            r'\b\d{2}-\d{2}-\d{2}-\d{2,5}\b',            # NN-NN-NN-NNNNN format
-            r'\b[A-Z0-9]{10,15}\b'                        # Long alphanumeric
-        ]
-        
-        if not record.parcel_number:
-            for pattern in parcel_patterns:
-                parcel_match = re.search(pattern, text)
-                if parcel_match:
-                    record.parcel_number = parcel_match.group().strip()
-                    break
-        
-        # Homestead status - Y/N or Yes/No patterns
-        homestead_pattern = r'\b(Y|N|Yes|No|TRUE|FALSE)\b'
-        if not record.homesteaded:
-            homestead_match = re.search(homestead_pattern, text, re.IGNORECASE)
-            if homestead_match:
-                record.homesteaded = homestead_match.group().strip()
-
-    def navigate_to_next_page(self, current_page: int) -> bool:
-        """Navigate to next page"""
-        try:
-            print(f"🔄 Looking for next page button on page {current_page}...")
-            
-            # Common next page patterns
-            next_patterns = [
-                "//a[contains(text(), 'Next')]",
-                "//button[contains(text(), 'Next')]",
-                "//input[contains(@value, 'Next')]",
-                "//a[contains(text(), '>')]",
-                "//button[contains(text(), '>')]",
-                f"//a[text()='{current_page + 1}']",
-                "//a[@title='Next Page']",
-                "//*[contains(@class, 'next')]",
-                "//*[contains(@id, 'next')]"
-            ]
-            
-            for pattern in next_patterns:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            print(f"   Found next button: {element.text or element.get_attribute('value')}")
-                            
-                            # Scroll to element
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                            time.sleep(1)
-                            
-                            # Click using JavaScript for reliability
-                            self.driver.execute_script("arguments[0].click();", element)
-                            
-                            print(f"✅ Clicked next page button")
-                            
-                            # Wait for page to load
-                            self.wait_for_page_load(15)
-                            
-                            return True
-                            
-                except Exception as e:
-                    continue
-            
-            print("🚫 No next page button found - reached end")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error navigating to next page: {e}")
-            print(f"❌ Error navigating to next page: {e}")
-            return False
-
-    def save_results_to_csv(self, filename: str = None) -> str:
-        """Save all extracted records to CSV"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"extracted/multi_page_properties_{timestamp}.csv"
-        
-        os.makedirs("extracted", exist_ok=True)
-        
-        if not self.all_records:
-            print("⚠️ No records to save")
-            return filename
-        
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                # Get all field names from the dataclass
-                fieldnames = list(asdict(self.all_records[0]).keys())
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for record in self.all_records:
-                    writer.writerow(asdict(record))
-            
-            print(f"✅ Saved {len(self.all_records)} records to {filename}")
-            return filename
-            
-        except Exception as e:
-            self.logger.error(f"Error saving CSV: {e}")
-            print(f"❌ Error saving CSV: {e}")
-            return filename
-
-    def run_multi_page_extraction(self, max_pages: int = 50):
-        """Main extraction workflow"""
-        print("🚀 Starting Multi-Page Property Extraction")
-        print("=" * 60)
-        
-        # Connect to browser
-        if not self.connect_to_browser():
-            return
-        
-        # Detect total pages available
-        self.total_pages = self.detect_total_pages()
-        
-        if self.total_pages:
-            print(f"📊 Total pages detected: {self.total_pages}")
-            actual_max_pages = min(max_pages, self.total_pages)
-        else:
-            print(f"🔍 Page count unknown, will detect during navigation (max {max_pages})")
-            actual_max_pages = max_pages
-        
-        # Get current page number
-        self.current_page = self.get_current_page_number()
-        print(f"📍 Starting from page: {self.current_page}")
-        
-        page_number = self.current_page
-        consecutive_empty_pages = 0
-        
-        try:
-            while page_number <= actual_max_pages:
-                print(f"\n📄 Processing Page {page_number}")
-                if self.total_pages:
-                    print(f"    Progress: {page_number}/{self.total_pages} ({(page_number/self.total_pages*100):.1f}%)")
-                print("-" * 40)
-                
-                # Extract data from current page
-                page_records = self.extract_current_page_data(page_number)
-                
-                if page_records:
-                    self.all_records.extend(page_records)
-                    consecutive_empty_pages = 0
-                    print(f"📊 Page {page_number}: {len(page_records)} records")
-                    print(f"📈 Total so far: {len(self.all_records)} records")
-                else:
-                    consecutive_empty_pages += 1
-                    print(f"⚠️ Page {page_number}: No data found")
-                    
-                    if consecutive_empty_pages >= 3:
-                        print("🛑 Found 3 consecutive empty pages. Stopping extraction.")
-                        break
-                
-                # Check if we've reached the known total
-                if self.total_pages and page_number >= self.total_pages:
-                    print(f"🏁 Reached final page ({self.total_pages}). Extraction complete.")
-                    break
-                
-                # Try to navigate to next page
-                if not self.navigate_to_next_page(page_number):
-                    print(f"🏁 No more pages found. Extraction complete.")
-                    break
-                
-                page_number += 1
-                self.current_page = page_number
-                
-                # Wait 8 seconds as requested
-                if page_number <= actual_max_pages:
-                    if self.total_pages:
-                        print(f"⏱️ Waiting 8 seconds before processing page {page_number}/{self.total_pages}...")
-                    else:
-                        print(f"⏱️ Waiting 8 seconds before processing page {page_number}...")
-                    time.sleep(8)
-            
-            # Save results
-            print(f"\n🎉 Extraction Complete!")
-            print("=" * 60)
-            print(f"📊 Total pages processed: {page_number}")
-            print(f"📊 Total records extracted: {len(self.all_records)}")
-            
-            if self.all_records:
-                csv_file = self.save_results_to_csv()
-                print(f"💾 Results saved to: {csv_file}")
-            
-        except KeyboardInterrupt:
-            print(f"\n⏹️ Extraction stopped by user")
-            if self.all_records:
-                csv_file = self.save_results_to_csv()
-                print(f"💾 Partial results saved to: {csv_file}")
-        
-        except Exception as e:
-            self.logger.error(f"Fatal error in extraction: {e}")
-            print(f"❌ Fatal error: {e}")
-            if self.all_records:
-                csv_file = self.save_results_to_csv()
-                print(f"💾 Partial results saved to: {csv_file}")
-        
-        finally:
-            print("\n👋 Multi-page extraction finished")
-
-if __name__ == "__main__":
-    print("Multi-Page Palm Beach County Property Extractor")
-    print("=" * 60)
-    print("This script will automatically:")
-    print("• Connect to your existing browser session")
-    print("• Extract data from all pages")
-    print("• Navigate between pages every 8 seconds")
-    print("• Save everything to one CSV file")
-    print()
-    
-    extractor = MultiPageExtractor(debug_mode=True)
+#!/usr/bin/env python3
+"""
+Multi-Page Property Extractor for Palm Beach County Property Appraiser
+
+This script automatically:
+1. Connects to existing browser session from pbc_property_search.py
+2. Extracts data from current page
+3. Navigates to the next page as soon as it has loaded
+4. Combines all data into one large CSV file
+5. Continues until no more pages are found
+"""
+
+import time
+import csv
+import json
+import logging
+import random
+import re
+from datetime import datetime
+from typing import List, Dict, Optional
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from dataclasses import dataclass, fields
+from operator import attrgetter
+import os
+import lxml.html
+
+# Patterns used by extract_patterns_from_text, compiled once per process
+# instead of once per row/line
+_DOLLAR_RE = re.compile(r'\$[\d,]+\.?\d*')
+_DATE_RES = (
+    re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b'),            # MM/DD/YYYY
+    re.compile(r'\b\d{1,2}-\d{1,2}-\d{4}\b'),            # MM-DD-YYYY
+    re.compile(r'\b\d{4}-\d{1,2}-\d{1,2}\b'),            # YYYY-MM-DD
+    re.compile(r'\b[A-Za-z]{3}\s+\d{1,2},?\s+\d{4}\b'),  # Jan 15, 2024
+)
+_ADDRESS_RES = (
+    re.compile(r'\b\d+\s+[A-Za-z\s]+(St|Street|Ave|Avenue|Blvd|Boulevard|Rd|Road|Ln|Lane|Ct|Court|Dr|Drive|Way|Pl|Place)\b', re.IGNORECASE),
+    re.compile(r'\b\d+\s+[A-Z][A-Za-z\s]+\s+(ST|AVE|BLVD|RD|LN|CT|DR|WAY|PL)\b', re.IGNORECASE),
+)
+_NAME_LAST_FIRST_RE = re.compile(r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_NAME_FIRST_LAST_RE = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_NAME_ALLCAPS_RE = re.compile(r'\b[A-Z][A-Z\s]+[A-Z]\b')
+_MUNICIPALITY_RES = (
+    re.compile(r'\b(Palm Beach|West Palm Beach|Boca Raton|Delray Beach|Boynton Beach|Wellington|Jupiter|Lake Worth)\b', re.IGNORECASE),
+    re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', re.IGNORECASE),
+)
+_SQFT_RE = re.compile(r'\b([1-9]\d{2,4})\b')  # 100-99999 range
+_PARCEL_RES = (
+    re.compile(r'\b[A-Z0-9]{2,3}-[0-9]{2,4}-[0-9]{2,4}\b'),  # XX-XXXX-XXXX format
+    re.compile(r'\b\d{2}-\d{2}-\d{2}-\d{2,5}\b'),            # NN-NN-NN-NNNNN format
+    re.compile(r'\b[A-Z0-9]{10,15}\b'),                       # Long alphanumeric
+)
+_HOMESTEAD_RE = re.compile(r'\b(Y|N|Yes|No|TRUE|FALSE)\b', re.IGNORECASE)
+
+# Cell-classification predicates - one C-level regex test per cell instead
+# of replace()/isdigit()/isalpha() chains that rescan the string several
+# times. The lookaheads require at least one real digit/letter, which also
+# fixes the old chains accepting strings like '.' or ','
+_HAS_DIGIT_RE = re.compile(r'\d')
+_NUMERIC_RE = re.compile(r'(?=.*\d)[\d,.]+$')              # digits plus , .
+_NUMERIC_SPACED_RE = re.compile(r'(?=.*\d)[\d,. ]+$')      # ... and spaces
+_ALPHA_SPACE_RE = re.compile(r'(?=.*[A-Za-z])[A-Za-z ]+$')
+_ALPHA_SPACE_DASH_RE = re.compile(r'(?=.*[A-Za-z])[A-Za-z -]+$')
+_ALPHA_WORD_RE = re.compile(r'(?=.*[A-Za-z])[A-Za-z,.]+$')  # name tokens
+
+# Street-suffix and city sniffs - one case-insensitive alternation pass
+# instead of upper-casing the cell and running seven substring scans. The
+# word boundaries also stop suffixes matching inside names ('ST' in
+# 'STEVENS'), which the old substring tests did
+_STREET_RE = re.compile(r'\b(ST|AVE|BLVD|RD|LN|CT|DR|WAY|PL)\b', re.I)
+_STREET_SHORT_RE = re.compile(r'\b(ST|AVE|BLVD|RD|LN|CT|DR)\b', re.I)
+_CITY_RE = re.compile(r'PALM BEACH|WEST PALM|BOCA|DELRAY|BOYNTON|WELLINGTON|JUPITER', re.I)
+_CITY_SHORT_RE = re.compile(r'PALM BEACH|WEST PALM|BOCA|DELRAY|BOYNTON', re.I)
+_MONTH_RE = re.compile(r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec', re.I)
+
+# Catch-all cell classifier: one alternation pass tags the context-free
+# cell shapes (dollar amount, street suffix, pure-numeric), and the
+# dispatch table below fills the matching still-empty field. lastgroup
+# names the winning branch, so there is no Python if/elif chain per cell
+_CELL_TAG_RE = re.compile(
+    r'(?P<sale_price>\$)'
+    r'|(?P<property_address>\b(?:ST|AVE|BLVD|RD|LN|CT|DR|WAY|PL)\b)'
+    r'|(?P<square_footage>\A(?=.*\d)[\d,.]+\Z)',
+    re.I,
+)
+
+def _assign_if_empty(field):
+    """Build a first-wins field setter for the cell dispatch table"""
+    def _set(record, text):
+        if not getattr(record, field):
+            setattr(record, field, text)
+    return _set
+
+def _assign_sqft(record, text):
+    """Numeric cells only count as square footage in house-size range"""
+    if not record.square_footage and 500 <= int(float(text.replace(',', ''))) <= 50000:
+        record.square_footage = text
+
+_CELL_SETTERS = {
+    'sale_price': _assign_if_empty('sale_price'),
+    'property_address': _assign_if_empty('property_address'),
+    'square_footage': _assign_sqft,
+}
+
+# slots=True drops the per-instance __dict__ - with 18 fields that's a
+# real saving across a multi-thousand-record run, and attribute access
+# gets faster during CSV writing
+@dataclass(slots=True)
+class PropertyRecord:
+    """PAPA GetSalesSearch results structure - matching exact page layout"""
+    # Core fields in exact order from GetSalesSearch page
+    sale_price: str = ""           # Sale Price (first priority field)
+    sale_date: str = ""            # Sale Date 
+    owner_name: str = ""           # Owner Name
+    property_address: str = ""     # Location/Property Address
+    municipality: str = ""         # Municipality
+    square_footage: str = ""       # Sq. Ft
+    mail_address: str = ""         # Mail Address
+    mail_city_state_zip: str = ""  # Mail City, State, Zip
+    homesteaded: str = ""          # Homestead status
+    
+    # Additional useful fields (secondary priority)
+    parcel_number: str = ""        # Parcel/Account Number
+    property_value: str = ""       # Assessed/Market Value
+    lot_size: str = ""            # Lot Size
+    year_built: str = ""          # Year Built
+    property_type: str = ""       # Property Type
+    
+    # Meta fields
+    record_url: str = ""          # Link to detailed record
+    extraction_date: str = ""     # When extracted
+    page_number: int = 0          # Which results page
+
+# CSV layout: dataclass field order plus the attrgetter that pulls a whole
+# row of attributes in one C call - no per-record asdict() deep copies
+CSV_FIELDS = tuple(f.name for f in fields(PropertyRecord))
+_CSV_GET = attrgetter(*CSV_FIELDS)
+
+class MultiPageExtractor:
+    def __init__(self, debug_mode: bool = True):
+        self.debug_mode = debug_mode
+        self.driver = None
+        self.logger = self.setup_logging()
+        self.total_records = 0
+        self._csv_fh = None
+        self._csv_writer = None
+        self._csv_path = None
+        self.total_pages = None
+        self.current_page = 1
+        
+    def setup_logging(self):
+        """Setup logging configuration"""
+        log_filename = f"multi_page_extractor_{datetime.now().strftime('%Y%m%d')}.log"
+        log_path = os.path.join("extracted", log_filename)
+        
+        # Create extracted directory if it doesn't exist
+        if not os.path.isdir("extracted"):
+            os.mkdir("extracted")
+        
+        logging.basicConfig(
+            level=logging.INFO if self.debug_mode else logging.WARNING,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler(log_path),
+                logging.StreamHandler()
+            ],
+            force=True
+        )
+        return logging.getLogger(__name__)
+
+    def connect_to_browser(self) -> bool:
+        """Connect to existing browser session"""
+        # Reuse a live cached connection - a cheap JS probe beats
+        # re-instantiating webdriver.Chrome on every call
+        if self.driver:
+            try:
+                self.driver.execute_script("return 1")
+                return True
+            except Exception:
+                self.driver = None  # Stale session, reconnect below
+
+        try:
+            self.logger.info("🔗 Connecting to existing Chrome browser session...")
+            chrome_options = Options()
+            chrome_options.add_experimental_option("debuggerAddress", "localhost:9222")
+            # DOMContentLoaded is enough - the table is server-rendered
+            chrome_options.page_load_strategy = "eager"
+
+            self.driver = webdriver.Chrome(options=chrome_options)
+            
+            current_url = self.driver.current_url
+            page_title = self.driver.title
+            
+            self.logger.info("✅ Connected to browser successfully!")
+            self.logger.info("   Current page: %s", page_title)
+            self.logger.info("   URL: %s", current_url)
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error("❌ Failed to connect to browser session: %s", e)
+            self.logger.info("Make sure you ran 'python3 pbc_property_search.py' first and browser is still open")
+            return False
+
+    def wait_for_page_load(self, timeout: int = 10) -> bool:
+        """Wait for page to fully load, polling with exponential backoff"""
+        deadline = time.monotonic() + timeout
+        interval = 0.25
+
+        while time.monotonic() < deadline:
+            try:
+                if self.driver.execute_script("return document.readyState") == "complete":
+                    return True
+            except Exception:
+                pass
+            time.sleep(interval)
+            interval = min(2.0, interval * 1.5)
+
+        self.logger.warning("Page load timeout after %s seconds", timeout)
+        return False
+
+    def detect_total_pages(self) -> int:
+        """Detect total number of pages from pagination controls"""
+        try:
+            self.logger.info("🔍 Detecting total number of pages...")
+            
+            # Common pagination patterns to find total pages
+            total_page_patterns = [
+                # "Page 1 of 15" format
+                "//text()[contains(., 'Page') and contains(., 'of')]",
+                "//span[contains(text(), 'of') and contains(text(), 'Page')]",
+                "//div[contains(text(), 'of') and contains(text(), 'Page')]",
+                
+                # "1 of 15" or "1/15" format
+                "//text()[contains(., 'of ') and preceding-sibling::*[contains(., '1')]]",
+                "//*[contains(text(), 'of ') and contains(text(), '/')]",
+                
+                # Last page number in pagination
+                "//*[contains(@class, 'pagination')]//a[last()]",
+                "//*[contains(@class, 'pager')]//a[last()]",
+                "//*[contains(@id, 'pagination')]//a[last()]",
+                
+                # Look for highest numbered page link
+                "//a[contains(@href, 'page') or contains(@href, 'Page')]",
+                "//a[text() and string-length(text()) <= 3 and translate(text(), '0123456789', '') = '']"
+            ]
+            
+            max_pages_found = 0
+            
+            # Try text-based detection first
+            for pattern in total_page_patterns[:5]:
+                try:
+                    elements = self.driver.find_elements(By.XPATH, pattern)
+                    for element in elements:
+                        text = element.text if hasattr(element, 'text') else str(element)
+                        
+                        # Look for "Page X of Y" or "X of Y" patterns
+                        matches = re.findall(r'(?:Page\s+)?(\d+)\s+of\s+(\d+)', text, re.IGNORECASE)
+                        if matches:
+                            total = int(matches[0][1])
+                            current = int(matches[0][0])
+                            self.logger.info("   Found pagination text: '%s' -> Total pages: %s", text, total)
+                            self.current_page = current
+                            return total
+                            
+                        # Look for "X/Y" format
+                        matches = re.findall(r'(\d+)\s*/\s*(\d+)', text)
+                        if matches:
+                            total = int(matches[0][1])
+                            current = int(matches[0][0])
+                            self.logger.info("   Found pagination text: '%s' -> Total pages: %s", text, total)
+                            self.current_page = current
+                            return total
+                            
+                except Exception as e:
+                    continue
+            
+            # Try numbered page links detection
+            self.logger.info("   Trying numbered page links detection...")
+            try:
+                page_links = self.driver.find_elements(By.XPATH, "//a[text() and string-length(text()) <= 3 and translate(text(), '0123456789', '') = '']")
+                page_numbers = []
+                
+                for link in page_links:
+                    try:
+                        page_num = int(link.text.strip())
+                        if 1 <= page_num <= 1000:  # Reasonable range
+                            page_numbers.append(page_num)
+                    except (ValueError, AttributeError):
+                        continue
+                
+                if page_numbers:
+                    max_pages_found = max(page_numbers)
+                    self.logger.info("   Found page numbers: %s -> Max page: %s", sorted(set(page_numbers)), max_pages_found)
+                    
+            except Exception as e:
+                self.logger.error("Error detecting page numbers: %s", e)
+            
+            # Try pagination container analysis
+            self.logger.info("   Trying pagination container analysis...")
+            try:
+                pagination_containers = self.driver.find_elements(By.XPATH, "//*[contains(@class, 'pagination') or contains(@class, 'pager') or contains(@id, 'pagination')]")
+                
+                for container in pagination_containers:
+                    # Look for any numbers in the container
+                    container_text = container.text
+                    numbers = re.findall(r'\b(\d+)\b', container_text)
+                    if numbers:
+                        # Take the largest reasonable number as potential max page
+                        largest_num = max([int(n) for n in numbers if 1 <= int(n) <= 1000])
+                        if largest_num > max_pages_found:
+                            max_pages_found = largest_num
+                            self.logger.info("   Found in pagination container: %s -> Potential max page: %s", container_text, largest_num)
+                            
+            except Exception as e:
+                self.logger.error("Error analyzing pagination containers: %s", e)
+            
+            # Final fallback - look for any "next" or "last" indicators
+            if max_pages_found == 0:
+                self.logger.info("   No specific page count found, will detect dynamically during navigation")
+                return None
+            
+            self.logger.info("✅ Detected total pages: %s", max_pages_found)
+            return max_pages_found
+            
+        except Exception as e:
+            self.logger.error("⚠️ Could not detect total pages: %s", e)
+            return None
+
+    def get_current_page_number(self) -> int:
+        """Try to detect current page number from the page"""
+        try:
+            # Look for current page indicators
+            patterns = [
+                "//span[contains(@class, 'current') or contains(@class, 'active')]",
+                "//a[contains(@class, 'current') or contains(@class, 'active')]",
+                "//li[contains(@class, 'current') or contains(@class, 'active')]//a",
+                "//*[contains(@class, 'pagination')]//*[contains(@class, 'current') or contains(@class, 'active')]"
+            ]
+            
+            for pattern in patterns:
+                try:
+                    elements = self.driver.find_elements(By.XPATH, pattern)
+                    for element in elements:
+                        text = element.text.strip()
+                        if text.isdigit() and 1 <= int(text) <= 1000:
+                            return int(text)
+                except:
+                    continue
+                    
+            return self.current_page  # Fallback to tracked page
+            
+        except Exception as e:
+            self.logger.error("Error detecting current page: %s", e)
+            return self.current_page
+
+    def extract_current_page_data(self, page_number: int) -> List[PropertyRecord]:
+        """Extract property data from current page"""
+        self.logger.info("📄 Extracting data from page %s...", page_number)
+        records = []
+        
+        try:
+            # One timestamp per page - every record on the page shares it
+            # instead of paying a strftime call per row
+            page_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # Wait for page to load
+            self.wait_for_page_load()
+
+            # Pull the page once and parse it in-process: all harvesting
+            # below walks the lxml tree, with no further WebDriver traffic
+            tree = lxml.html.fromstring(self.driver.page_source)
+            tree.make_links_absolute(self.driver.current_url)
+
+            # Look for common table structures first
+            tables = tree.findall('.//table')
+
+            if tables:
+                self.logger.info("   Found %s tables on page", len(tables))
+                for table_idx, table in enumerate(tables):
+                    table_records = self.extract_from_table(table, page_number, page_ts)
+                    records.extend(table_records)
+                    self.logger.info("   Table %s: %s records", table_idx + 1, len(table_records))
+
+            # If no tables, look for result rows/divs
+            if not records:
+                result_rows = self.find_result_rows(tree)
+                if result_rows:
+                    self.logger.info("   Found %s result rows", len(result_rows))
+                    records = self.extract_from_rows(result_rows, page_number, page_ts)
+
+            # Fallback to text extraction
+            if not records:
+                self.logger.info("   Using fallback text extraction...")
+                records = self.extract_from_text(tree, page_number, page_ts)
+            
+            self.logger.info("✅ Extracted %s records from page %s", len(records), page_number)
+            return records
+            
+        except Exception as e:
+            self.logger.error("❌ Error extracting data from page %s: %s", page_number, e)
+            return []
+
+    def extract_from_table(self, table, page_number: int, page_ts: str) -> List[PropertyRecord]:
+        """Extract data from a GetSalesSearch results table with proper field mapping.
+
+        `table` is an element of the locally parsed page tree, so the
+        row/cell/link harvest below is pure in-process lxml work.
+        """
+        records = []
+
+        try:
+            rows = [
+                {
+                    'cells': [cell.text_content().strip() for cell in tr.xpath('./td | ./th')],
+                    'href': next(iter(tr.xpath('.//a/@href')), ''),
+                }
+                for tr in table.xpath('.//tr')
+            ]
+
+            # Get header row to understand column structure (th and td cells
+            # both come back through tr.cells)
+            header_row = None
+            if rows and rows[0]['cells']:
+                header_row = [text.lower() for text in rows[0]['cells']]
+                self.logger.info("   📋 Table headers detected: %s", header_row)
+
+            # Process data rows (skip header)
+            data_rows = rows[1:] if len(rows) > 1 else rows
+
+            for row_idx, row in enumerate(data_rows):
+                cell_texts = row['cells']
+
+                if len(cell_texts) < 3:  # Skip rows with too few cells
+                    continue
+
+                record = PropertyRecord()
+                record.page_number = page_number
+                record.extraction_date = page_ts
+                
+                # Map fields based on GetSalesSearch typical column order
+                # Common GetSalesSearch columns: Sale Price, Sale Date, Owner, Address, Municipality, etc.
+                
+                if header_row:
+                    # Use header-based mapping
+                    for i, (header, text) in enumerate(zip(header_row, cell_texts)):
+                        if not text:
+                            continue
+                            
+                        # Map based on header content
+                        if any(keyword in header for keyword in ['sale', 'price']) and '$' in text:
+                            record.sale_price = text
+                        elif any(keyword in header for keyword in ['sale', 'date']) and ('/' in text or '-' in text):
+                            record.sale_date = text
+                        elif any(keyword in header for keyword in ['owner', 'name', 'taxpayer']):
+                            record.owner_name = text
+                        elif any(keyword in header for keyword in ['address', 'location', 'property']):
+                            record.property_address = text
+                        elif any(keyword in header for keyword in ['municipality', 'city']):
+                            record.municipality = text
+                        elif any(keyword in header for keyword in ['sq', 'sqft', 'footage']):
+                            record.square_footage = text
+                        elif any(keyword in header for keyword in ['mail', 'mailing']) and 'address' in header:
+                            record.mail_address = text
+                        elif any(keyword in header for keyword in ['mail']) and any(k in header for k in ['city', 'state', 'zip']):
+                            record.mail_city_state_zip = text
+                        elif any(keyword in header for keyword in ['homestead']):
+                            record.homesteaded = text
+                        elif any(keyword in header for keyword in ['parcel', 'account']):
+                            record.parcel_number = text
+                
+                else:
+                    # Fallback: position-based mapping (common GetSalesSearch order)
+                    self.logger.info("   ⚠️ No headers found, using position-based mapping")
+                    
+                    for i, text in enumerate(cell_texts):
+                        if not text:
+                            continue
+                        
+                        # Position-based field assignment for typical GetSalesSearch layout
+                        if i == 0:  # First column often sale price
+                            if '$' in text:
+                                record.sale_price = text
+                            elif _HAS_DIGIT_RE.search(text):
+                                record.parcel_number = text  # Sometimes parcel is first
+                        elif i == 1:  # Second column often sale date
+                            if '/' in text or '-' in text or _MONTH_RE.search(text):
+                                record.sale_date = text
+                            elif '$' in text and not record.sale_price:
+                                record.sale_price = text
+                        elif i == 2:  # Third column often owner name
+                            if (len(text) > 3 and
+                                not _NUMERIC_SPACED_RE.match(text) and
+                                not _STREET_RE.search(text)):
+                                record.owner_name = text
+                        elif i == 3:  # Fourth column often property address
+                            if _STREET_RE.search(text):
+                                record.property_address = text
+                        elif i == 4:  # Fifth column often municipality
+                            if len(text) > 2 and _ALPHA_SPACE_RE.match(text):
+                                record.municipality = text
+                        elif i == 5:  # Sixth column might be square footage
+                            if _NUMERIC_RE.match(text):
+                                record.square_footage = text
+                
+                # Additional pattern-based extraction for missed fields
+                for i, text in enumerate(cell_texts):
+                    # Saturated - every field this loop can fill is set, so
+                    # the remaining cells would only burn regex scans
+                    if (record.sale_price and record.owner_name and
+                            record.property_address and record.municipality and
+                            record.square_footage):
+                        break
+
+                    if not text:
+                        continue
+
+                    # Context-free shapes (price, street address, numeric)
+                    # resolve in a single classifier pass + table dispatch
+                    tag = _CELL_TAG_RE.search(text)
+                    if tag:
+                        _CELL_SETTERS[tag.lastgroup](record, text)
+                        continue
+
+                    # Owner and municipality need cross-field context, so
+                    # they stay as guarded checks on the untagged cells
+                    # (which are already known to hold no $, street suffix,
+                    # or pure number)
+                    if (not record.owner_name and
+                          len(text) > 3 and
+                          not _CITY_RE.search(text)):
+                        # Check if it has characteristics of a person's name
+                        words = text.split()
+                        if (len(words) >= 1 and
+                            all(_ALPHA_WORD_RE.match(word) for word in words) and
+                            any(word[0].isupper() for word in words if word)):  # At least one capitalized word
+                            record.owner_name = text.strip()
+
+                    # Municipality - look for city names (alphabetic, 2+ words or known cities)
+                    elif (_ALPHA_SPACE_DASH_RE.match(text) and
+                          len(text) > 2 and
+                          not record.municipality and
+                          text != record.owner_name):  # Don't confuse with owner name
+                        # Check if it looks like a city name
+                        if ' ' in text or _CITY_SHORT_RE.search(text):
+                            record.municipality = text
+                
+                # Link already captured by the harvest script
+                record.record_url = row['href']
+
+                # Debug: Show what we extracted for this row
+                if self.debug_mode:
+                    self.logger.info("   🔍 Row %s debug:", row_idx + 1)
+                    self.logger.info("      Raw cells: %s", cell_texts)
+                    self.logger.info("      Sale Price: '%s'", record.sale_price)
+                    self.logger.info("      Owner Name: '%s'", record.owner_name)
+                    self.logger.info("      Address: '%s'", record.property_address)
+                    self.logger.info("      Municipality: '%s'", record.municipality)
+                
+                # Only add record if it has core data
+                if (record.sale_price or record.property_address or record.owner_name or 
+                    record.municipality or record.parcel_number):
+                    records.append(record)
+                    self.logger.info("   ✓ Row %s: $%s | %s | %s", row_idx + 1, record.sale_price, record.owner_name, record.property_address)
+                else:
+                    self.logger.info("   ⚠️ Row %s: Insufficient data, skipped", row_idx + 1)
+                    if self.debug_mode:
+                        self.logger.info("      Available data: %s", [text for text in cell_texts if text])
+                        
+        except Exception as e:
+            self.logger.error("❌ Table extraction error: %s", e)
+            
+        return records
+
+    # All row patterns as one XPath union over the local tree - the class
+    # and id substrings cover the old per-selector queries
+    RESULT_ROW_XPATH = (
+        ".//div[contains(@class, 'result') or contains(@class, 'property') or contains(@class, 'record')]"
+        " | .//tr[contains(@class, 'result')]"
+        " | .//*[contains(@id, 'result')]"
+    )
+
+    def find_result_rows(self, tree):
+        """Find result rows in the parsed page using various patterns"""
+        try:
+            elements = tree.xpath(self.RESULT_ROW_XPATH)
+            if elements and len(elements) > 1:  # Found multiple results
+                return elements
+        except Exception:
+            pass
+
+        return []
+
+    def extract_from_rows(self, rows, page_number: int, page_ts: str) -> List[PropertyRecord]:
+        """Extract data from result rows/divs with proper field mapping"""
+        records = []
+
+        for row_idx, row in enumerate(rows):
+            try:
+                record = PropertyRecord()
+                record.page_number = page_number
+                record.extraction_date = page_ts
+
+                self.extract_patterns_from_text(row.text_content(), record)
+                record.record_url = next(iter(row.xpath('.//a/@href')), '')
+
+                # Only add if we have meaningful data
+                if (record.sale_price or record.property_address or record.owner_name or 
+                    record.municipality or record.parcel_number):
+                    records.append(record)
+                    self.logger.info("   ✓ Row %s: $%s | %s | %s", row_idx + 1, record.sale_price, record.owner_name, record.property_address)
+                    
+            except Exception as e:
+                self.logger.error("Error processing row: %s", e)
+                continue
+                
+        return records
+
+    def extract_from_text(self, tree, page_number: int, page_ts: str) -> List[PropertyRecord]:
+        """Fallback text extraction method"""
+        try:
+            # Drop script/style nodes first - text_content() would otherwise
+            # include inline JavaScript/CSS, and the pattern matching below
+            # happily pulls dates and dollar amounts out of script source
+            for element in list(tree.iter('script', 'style')):
+                element.drop_tree()
+            page_text = tree.text_content()
+            
+            # Split into potential records (basic heuristic)
+            lines = page_text.split('\n')
+            records = []
+            current_record = PropertyRecord()
+            current_record.page_number = page_number
+            current_record.extraction_date = page_ts
+            
+            for line in lines:
+                line = line.strip()
+                if line:
+                    self.extract_patterns_from_text(line, current_record)
+            
+            if current_record.property_address or current_record.owner_name:
+                records.append(current_record)
+                
+            return records
+            
+        except Exception as e:
+            self.logger.error("Error in text extraction: %s", e)
+            return []
+
+    def extract_patterns_from_text(self, text: str, record: PropertyRecord):
+        """Extract GetSalesSearch-specific patterns from text"""
+        # Sale Price - look for dollar amounts (prioritize sale price)
+        dollar_matches = _DOLLAR_RE.findall(text)
+        if dollar_matches and not record.sale_price:
+            record.sale_price = dollar_matches[0]  # First dollar amount is likely sale price
+
+        # Sale Date - various date formats
+        if not record.sale_date:
+            for pattern in _DATE_RES:
+                date_match = pattern.search(text)
+                if date_match:
+                    record.sale_date = date_match.group().strip()
+                    break
+
+        # Property Address - street address patterns
+        if not record.property_address:
+            for pattern in _ADDRESS_RES:
+                address_match = pattern.search(text)
+                if address_match:
+                    record.property_address = address_match.group().strip()
+                    break
+
+        # Owner Name - multiple patterns for better detection
+        if not record.owner_name:
+            # Pattern 1: Last, First format
+            name_match1 = _NAME_LAST_FIRST_RE.search(text)
+            if name_match1:
+                record.owner_name = name_match1.group().strip()
+            else:
+                # Pattern 2: First Last format (2+ words, proper case)
+                name_matches2 = _NAME_FIRST_LAST_RE.findall(text)
+                for name in name_matches2:
+                    # Skip if it looks like an address, municipality, or other non-name
+                    if (not _STREET_RE.search(name) and
+                        not _CITY_RE.search(name) and
+                        name.strip() != record.property_address and
+                        name.strip() != record.municipality and
+                        len(name.strip()) > 3):
+                        record.owner_name = name.strip()
+                        break
+                
+                # Pattern 3: Single capitalized word (less preferred but sometimes needed)
+                if not record.owner_name:
+                    name_match3 = _NAME_ALLCAPS_RE.search(text)  # ALL CAPS names
+                    if (name_match3 and
+                        len(name_match3.group().strip()) > 3 and
+                        not _STREET_SHORT_RE.search(name_match3.group())):
+                        record.owner_name = name_match3.group().strip()
+        
+        # Municipality - city names (alphabetic, often multiple words)
+        if not record.municipality:
+            for pattern in _MUNICIPALITY_RES:
+                muni_matches = pattern.findall(text)
+                for muni in muni_matches:
+                    # Skip addresses, owner names already captured, and small words
+                    if (not _STREET_SHORT_RE.search(muni) and
+                        muni != record.owner_name and
+                        muni != record.property_address and
+                        len(muni) > 2):
+                        record.municipality = muni.strip()
+                        break
+                if record.municipality:
+                    break
+        
+        # Square Footage - numeric values in reasonable range
+        if not record.square_footage:
+            sqft_matches = _SQFT_RE.findall(text)
+            for sqft in sqft_matches:
+                sqft_num = int(sqft)
+                if 500 <= sqft_num <= 50000:  # Reasonable house size range
+                    record.square_footage = sqft
+                    break
+        
+        # Parcel/Account numbers - alphanumeric with dashes
+        if not record.parcel_number:
+            for pattern in _PARCEL_RES:
+                parcel_match = pattern.search(text)
+                if parcel_match:
+                    record.parcel_number = parcel_match.group().strip()
+                    break
+
+        # Homestead status - Y/N or Yes/No patterns
+        if not record.homesteaded:
+            homestead_match = _HOMESTEAD_RE.search(text)
+            if homestead_match:
+                record.homesteaded = homestead_match.group().strip()
+
+    # Common next-page controls fused into one XPath union - a single
+    # find_elements round-trip instead of up to nine sequential queries
+    NEXT_XPATH_UNION = " | ".join((
+        "//a[contains(text(), 'Next')]",
+        "//button[contains(text(), 'Next')]",
+        "//input[contains(@value, 'Next')]",
+        "//a[contains(text(), '>')]",
+        "//button[contains(text(), '>')]",
+        "//a[@title='Next Page']",
+        "//*[contains(@class, 'next')]",
+        "//*[contains(@id, 'next')]",
+    ))
+
+    def navigate_to_next_page(self, current_page: int) -> bool:
+        """Navigate to next page"""
+        try:
+            self.logger.info("🔄 Looking for next page button on page %s...", current_page)
+
+            # One union query covers all the static patterns plus the direct
+            # link to the following page number
+            pattern = f"{self.NEXT_XPATH_UNION} | //a[text()='{current_page + 1}']"
+
+            for element in self.driver.find_elements(By.XPATH, pattern):
+                try:
+                    if not (element.is_displayed() and element.is_enabled()):
+                        continue
+
+                    self.logger.info("   Found next button: %s", element.text or element.get_attribute('value'))
+
+                    # Scroll to element
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                    time.sleep(1)
+
+                    # Capture the current body so navigation can be
+                    # detected by staleness instead of a blind sleep
+                    old_body = self.driver.find_element(By.TAG_NAME, "body")
+
+                    # Click using JavaScript for reliability
+                    self.driver.execute_script("arguments[0].click();", element)
+
+                    self.logger.info("✅ Clicked next page button")
+
+                    # Wait for the old document to go stale (no-op for
+                    # in-place AJAX updates), then for readyState
+                    try:
+                        WebDriverWait(self.driver, 15).until(EC.staleness_of(old_body))
+                    except TimeoutException:
+                        pass
+                    self.wait_for_page_load(15)
+
+                    return True
+
+                except Exception:
+                    continue
+
+            self.logger.info("🚫 No next page button found - reached end")
+            return False
+            
+        except Exception as e:
+            self.logger.error("❌ Error navigating to next page: %s", e)
+            return False
+
+    def open_csv_stream(self, filename: str = None) -> str:
+        """Open the run's CSV file and write the header row"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"extracted/multi_page_properties_{timestamp}.csv"
+
+        if not os.path.isdir("extracted"):
+            os.mkdir("extracted")
+
+        # 1 MiB buffer so a page's rows coalesce into one large write
+        # instead of hitting the default 8 KiB text buffer repeatedly
+        self._csv_fh = open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_writer.writerow(CSV_FIELDS)
+        self._csv_path = filename
+        return filename
+
+    def write_page_records(self, page_records: List[PropertyRecord]):
+        """Append one page's records to the open CSV and flush to disk.
+
+        Streaming per page keeps memory flat regardless of run length and
+        means a crash mid-run loses at most the current page.
+        """
+        self._csv_writer.writerows(map(_CSV_GET, page_records))
+        self._csv_fh.flush()
+        self.total_records += len(page_records)
+
+    def close_csv_stream(self):
+        """Close the CSV file if open"""
+        if self._csv_fh:
+            try:
+                self._csv_fh.close()
+            except Exception as e:
+                self.logger.error("Error closing CSV: %s", e)
+            self._csv_fh = None
+            self._csv_writer = None
+
+    def run_multi_page_extraction(self, max_pages: int = 50):
+        """Main extraction workflow"""
+        self.logger.info("🚀 Starting Multi-Page Property Extraction")
+        self.logger.info("=" * 60)
+        
+        # Connect to browser
+        if not self.connect_to_browser():
+            return
+
+        # Open the output file up front - records stream to disk per page
+        csv_file = self.open_csv_stream()
+        self.logger.info("💾 Streaming results to: %s", csv_file)
+
+        # Detect total pages available
+        self.total_pages = self.detect_total_pages()
+        
+        if self.total_pages:
+            self.logger.info("📊 Total pages detected: %s", self.total_pages)
+            actual_max_pages = min(max_pages, self.total_pages)
+        else:
+            self.logger.info("🔍 Page count unknown, will detect during navigation (max %s)", max_pages)
+            actual_max_pages = max_pages
+        
+        # Get current page number
+        self.current_page = self.get_current_page_number()
+        self.logger.info("📍 Starting from page: %s", self.current_page)
+        
+        page_number = self.current_page
+        consecutive_empty_pages = 0
+        
+        try:
+            while page_number <= actual_max_pages:
+                self.logger.info("\n📄 Processing Page %s", page_number)
+                if self.total_pages:
+                    self.logger.info("    Progress: %s/%s (%.1f%%)", page_number, self.total_pages, (page_number/self.total_pages*100))
+                self.logger.info("-" * 40)
+                
+                # Extract data from current page
+                page_records = self.extract_current_page_data(page_number)
+                
+                if page_records:
+                    self.write_page_records(page_records)
+                    consecutive_empty_pages = 0
+                    self.logger.info("📊 Page %s: %s records", page_number, len(page_records))
+                    self.logger.info("📈 Total so far: %s records", self.total_records)
+                else:
+                    consecutive_empty_pages += 1
+                    self.logger.info("⚠️ Page %s: No data found", page_number)
+                    
+                    if consecutive_empty_pages >= 3:
+                        self.logger.info("🛑 Found 3 consecutive empty pages. Stopping extraction.")
+                        break
+                
+                # Check if we've reached the known total
+                if self.total_pages and page_number >= self.total_pages:
+                    self.logger.info("🏁 Reached final page (%s). Extraction complete.", self.total_pages)
+                    break
+                
+                # Try to navigate to next page
+                if not self.navigate_to_next_page(page_number):
+                    self.logger.info("🏁 No more pages found. Extraction complete.")
+                    break
+                
+                page_number += 1
+                self.current_page = page_number
+                
+                # Short politeness jitter - page readiness is already
+                # confirmed by the staleness wait in navigate_to_next_page
+                if page_number <= actual_max_pages:
+                    delay = random.uniform(1.5, 3.5)
+                    if self.total_pages:
+                        self.logger.info("⏱️ Waiting %.1fs before processing page %s/%s...", delay, page_number, self.total_pages)
+                    else:
+                        self.logger.info("⏱️ Waiting %.1fs before processing page %s...", delay, page_number)
+                    time.sleep(delay)
+            
+            # Everything is already on disk - just report
+            self.logger.info("\n🎉 Extraction Complete!")
+            self.logger.info("=" * 60)
+            self.logger.info("📊 Total pages processed: %s", page_number)
+            self.logger.info("📊 Total records extracted: %s", self.total_records)
+
+            if self.total_records:
+                self.logger.info("💾 Results saved to: %s", csv_file)
+
+        except KeyboardInterrupt:
+            self.logger.info("\n⏹️ Extraction stopped by user")
+            if self.total_records:
+                self.logger.info("💾 Partial results already saved to: %s", csv_file)
+
+        except Exception as e:
+            self.logger.error("❌ Fatal error in extraction: %s", e)
+            if self.total_records:
+                self.logger.info("💾 Partial results already saved to: %s", csv_file)
+
+        finally:
+            self.close_csv_stream()
+            self.logger.info("\n👋 Multi-page extraction finished")
+
+def run(driver=None, max_pages: int = 50) -> MultiPageExtractor:
+    """Run the multi-page extraction, reusing an already-connected driver.
+
+    Orchestrators that hold a live WebDriver pass it here to skip the
+    debuggerAddress reconnect; with no driver the extractor attaches to the
+    session on localhost:9222 itself.
+    """
+    extractor = MultiPageExtractor(debug_mode=True)
+    extractor.driver = driver
+    extractor.run_multi_page_extraction(max_pages=max_pages)
+    return extractor
+
+if __name__ == "__main__":
+    print("Multi-Page Palm Beach County Property Extractor")
+    print("=" * 60)
+    print("This script will automatically:")
+    print("• Connect to your existing browser session")
+    print("• Extract data from all pages")
+    print("• Navigate between pages as soon as each one loads")
+    print("• Save everything to one CSV file")
+    print()
+    
+    extractor = MultiPageExtractor(debug_mode=True)
     extractor.run_multi_page_extraction()
\ No newline at end of file
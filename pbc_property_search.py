@@ -6,11 +6,45 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+import json
 import time
+from _driver_helpers import CHROME_PERF_FLAGS
 
-def search_palm_beach_properties():
+def wait_for_results_navigation(driver, timeout=30):
+    """
+    Wait for the browser to navigate to the GetSalesSearch results page.
+    Reads buffered CDP Page.frameNavigated events from the performance log so
+    this returns the instant the navigation happens, instead of sleeping a
+    fixed interval. Falls back to cheap URL polling when performance logging
+    is unavailable.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            for entry in driver.get_log("performance"):
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                if message.get("method") == "Page.frameNavigated":
+                    frame_url = message.get("params", {}).get("frame", {}).get("url", "")
+                    if "GetSalesSearch" in frame_url:
+                        return True
+        except Exception:
+            # Performance log not enabled/supported - poll the URL instead
+            try:
+                if "GetSalesSearch" in driver.current_url:
+                    return True
+            except Exception:
+                pass
+        time.sleep(0.25)
+
+    return "GetSalesSearch" in driver.current_url
+
+def run(headless=False):
     """
     Automates property search on Palm Beach County Property Appraiser website
+    and returns the live WebDriver sitting on the results page.
     Workflow:
     1. Opens https://pbcpao.gov/
     2. Clicks Advanced Sales Search button
@@ -19,17 +53,40 @@ def search_palm_beach_properties():
     5. Enters 5000 in first Square Footage Range box
     6. Submits search
     """
-    
+
     chrome_options = Options()
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    if headless:
+        # Headless scrape only needs the results table - skip images/CSS/fonts
+        chrome_options.add_argument("--headless")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-gpu")
+        # Only the server-rendered table matters - don't block on window.onload
+        # waiting for trailing analytics/beacons
+        chrome_options.page_load_strategy = "eager"
+        for flag in CHROME_PERF_FLAGS:
+            chrome_options.add_argument(flag)
     # Enable remote debugging so extractor can connect to this session
     chrome_options.add_argument("--remote-debugging-port=9222")
-    
+    # Buffer CDP page events so we can detect the results navigation instantly
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
     print("Starting Chrome with remote debugging enabled...")
     print("This allows the data extractor to connect to this browser session.")
-    
+
     driver = webdriver.Chrome(options=chrome_options)
+
+    try:
+        driver.execute_cdp_cmd("Page.enable", {})
+    except Exception:
+        pass  # CDP unavailable - wait_for_results_navigation falls back to polling
     
     try:
         print("Opening Palm Beach County Property Appraiser main page...")
@@ -60,17 +117,24 @@ def search_palm_beach_properties():
                     print("Found Advanced Search link/button")
                 except:
                     print("Available links and buttons on page:")
-                    links = driver.find_elements(By.TAG_NAME, "a")
-                    buttons = driver.find_elements(By.TAG_NAME, "button")
-                    
-                    for i, link in enumerate(links[:10]):
-                        text = link.text.strip()
-                        href = link.get_attribute("href") or "no href"
-                        if text:
-                            print(f"Link {i}: '{text}' -> {href}")
-                    
-                    for i, button in enumerate(buttons[:10]):
-                        text = button.text.strip()
+                    # One batched JS call instead of per-element text/href RPCs
+                    page_debug = driver.execute_script("""
+                        return {
+                            links: [...document.querySelectorAll('a')].slice(0, 10).map(el => ({
+                                text: (el.textContent || '').trim(),
+                                href: el.href || 'no href'
+                            })),
+                            buttons: [...document.querySelectorAll('button')].slice(0, 10).map(
+                                el => (el.textContent || '').trim()
+                            )
+                        };
+                    """)
+
+                    for i, link in enumerate(page_debug['links']):
+                        if link['text']:
+                            print(f"Link {i}: '{link['text']}' -> {link['href']}")
+
+                    for i, text in enumerate(page_debug['buttons']):
                         if text:
                             print(f"Button {i}: '{text}'")
         
@@ -105,18 +169,17 @@ def search_palm_beach_properties():
                     print("Found Commercial option")
                 except:
                     print("Available radio buttons and checkboxes:")
-                    radios = driver.find_elements(By.XPATH, "//input[@type='radio']")
-                    checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox']")
-                    
-                    for i, radio in enumerate(radios):
-                        name = radio.get_attribute("name") or "no name"
-                        value = radio.get_attribute("value") or "no value"
-                        nearby_text = driver.execute_script("""
-                            var element = arguments[0];
-                            var parent = element.parentElement;
-                            return parent ? parent.textContent.trim().substring(0, 50) : '';
-                        """, radio)
-                        print(f"Radio {i}: name='{name}', value='{value}', nearby: '{nearby_text}'")
+                    # One batched JS call instead of 3 RPCs per radio button
+                    radio_info = driver.execute_script("""
+                        return [...document.querySelectorAll('input[type=radio]')].map(el => ({
+                            name: el.name || 'no name',
+                            value: el.value || 'no value',
+                            nearby: el.parentElement ? el.parentElement.textContent.trim().substring(0, 50) : ''
+                        }));
+                    """)
+
+                    for i, radio in enumerate(radio_info):
+                        print(f"Radio {i}: name='{radio['name']}', value='{radio['value']}', nearby: '{radio['nearby']}'")
         
         if commercial_option:
             print("Clicking Commercial option...")
@@ -166,15 +229,16 @@ def search_palm_beach_properties():
                 except:
                     selects = driver.find_elements(By.TAG_NAME, "select")
                     print("Available select elements:")
-                    for i, select in enumerate(selects):
-                        name = select.get_attribute("name") or "no name"
-                        id_attr = select.get_attribute("id") or "no id"
-                        nearby_text = driver.execute_script("""
-                            var element = arguments[0];
-                            var parent = element.parentElement;
-                            return parent ? parent.textContent.trim().substring(0, 50) : '';
-                        """, select)
-                        print(f"Select {i}: name='{name}', id='{id_attr}', nearby text: '{nearby_text}'")
+                    # Batch name/id/nearby text for all selects in one JS call
+                    select_info = driver.execute_script("""
+                        return arguments[0].map(el => ({
+                            name: el.name || 'no name',
+                            id: el.id || 'no id',
+                            nearby: el.parentElement ? el.parentElement.textContent.trim().substring(0, 50) : ''
+                        }));
+                    """, selects)
+                    for i, info in enumerate(select_info):
+                        print(f"Select {i}: name='{info['name']}', id='{info['id']}', nearby text: '{info['nearby']}'")
                     
                     if selects:
                         municipality_dropdown = selects[0]
@@ -284,20 +348,22 @@ def search_palm_beach_properties():
                 except:
                     inputs = driver.find_elements(By.TAG_NAME, "input")
                     print("Available input fields:")
-                    for i, inp in enumerate(inputs):
-                        name = inp.get_attribute("name") or "no name"
-                        id_attr = inp.get_attribute("id") or "no id"
-                        placeholder = inp.get_attribute("placeholder") or "no placeholder"
-                        input_type = inp.get_attribute("type") or "text"
-                        nearby_text = driver.execute_script("""
-                            var element = arguments[0];
-                            var parent = element.parentElement;
-                            return parent ? parent.textContent.trim().substring(0, 80) : '';
-                        """, inp)
-                        print(f"Input {i}: name='{name}', id='{id_attr}', type='{input_type}', placeholder='{placeholder}'")
-                        print(f"         nearby text: '{nearby_text}'")
-                        
-                        if ("square" in nearby_text.lower() or "footage" in nearby_text.lower()) and input_type in ['text', 'number']:
+                    # Batch all attributes/nearby text in one JS call; the
+                    # element handles stay available for the match below
+                    input_info = driver.execute_script("""
+                        return arguments[0].map(el => ({
+                            name: el.name || 'no name',
+                            id: el.id || 'no id',
+                            placeholder: el.placeholder || 'no placeholder',
+                            type: el.type || 'text',
+                            nearby: el.parentElement ? el.parentElement.textContent.trim().substring(0, 80) : ''
+                        }));
+                    """, inputs)
+                    for i, (inp, info) in enumerate(zip(inputs, input_info)):
+                        print(f"Input {i}: name='{info['name']}', id='{info['id']}', type='{info['type']}', placeholder='{info['placeholder']}'")
+                        print(f"         nearby text: '{info['nearby']}'")
+
+                        if ("square" in info['nearby'].lower() or "footage" in info['nearby'].lower()) and info['type'] in ['text', 'number']:
                             sqft_input = inp
                             print(f"✓ Using input {i} as first Square Footage field")
                             break
@@ -355,25 +421,31 @@ def search_palm_beach_properties():
                     print("Available buttons and submit inputs:")
                     buttons = driver.find_elements(By.TAG_NAME, "button")
                     submits = driver.find_elements(By.XPATH, "//input[@type='submit']")
-                    
-                    for i, button in enumerate(buttons):
-                        text = button.text.strip()
-                        button_type = button.get_attribute("type") or "button"
-                        onclick = button.get_attribute("onclick") or "no onclick"
-                        print(f"Button {i}: '{text}' type='{button_type}' onclick='{onclick}'")
-                        
+
+                    # Batch text/type/onclick for every button in one JS call
+                    button_info = driver.execute_script("""
+                        return arguments[0].map(el => ({
+                            text: (el.textContent || '').trim(),
+                            type: el.getAttribute('type') || 'button',
+                            onclick: el.getAttribute('onclick') || 'no onclick'
+                        }));
+                    """, buttons)
+                    for i, (button, info) in enumerate(zip(buttons, button_info)):
+                        print(f"Button {i}: '{info['text']}' type='{info['type']}' onclick='{info['onclick']}'")
+
                         # Use the first button that looks like a search/submit button
                         if not search_button and (
-                            "search" in text.lower() or 
-                            "submit" in text.lower() or 
-                            button_type == "submit" or
-                            "search" in onclick.lower()
+                            "search" in info['text'].lower() or
+                            "submit" in info['text'].lower() or
+                            info['type'] == "submit" or
+                            "search" in info['onclick'].lower()
                         ):
                             search_button = button
                             print(f"✓ Using button {i} as search button")
-                    
-                    for i, submit in enumerate(submits):
-                        value = submit.get_attribute("value") or "Submit"
+
+                    submit_values = driver.execute_script(
+                        "return arguments[0].map(el => el.value || 'Submit');", submits)
+                    for i, (submit, value) in enumerate(zip(submits, submit_values)):
                         print(f"Submit input {i}: value='{value}'")
                         if not search_button:
                             search_button = submit
@@ -386,7 +458,7 @@ def search_palm_beach_properties():
             print("✓ Search button clicked!")
             
             print("Waiting for search results to load...")
-            time.sleep(5)  # Wait for results to load
+            wait_for_results_navigation(driver)
             
             # Check if we're on a results page
             try:
@@ -413,24 +485,35 @@ def search_palm_beach_properties():
             print("2. Wait for results to load completely")
             print("3. In another terminal, run: python3 enhanced_property_extractor.py")
         
-        # Keep browser open indefinitely for data extraction
-        try:
-            while True:
-                response = input("\nType 'quit' to close browser, or press ENTER to keep waiting: ").strip().lower()
-                if response == 'quit':
-                    print("Closing browser...")
-                    break
-                else:
-                    print("Browser staying open for data extraction...")
-                    time.sleep(1)
-        except KeyboardInterrupt:
-            print("\nBrowser will be closed...")
-        
+        return driver
+
     except Exception as e:
         print(f"An error occurred: {str(e)}")
         import traceback
         traceback.print_exc()
-    
+        print("Closing browser...")
+        driver.quit()
+        raise
+
+def search_palm_beach_properties():
+    """Run the search interactively, then keep the browser open for extraction"""
+    try:
+        driver = run()
+    except Exception:
+        return
+
+    # Keep browser open indefinitely for data extraction
+    try:
+        while True:
+            response = input("\nType 'quit' to close browser, or press ENTER to keep waiting: ").strip().lower()
+            if response == 'quit':
+                print("Closing browser...")
+                break
+            else:
+                print("Browser staying open for data extraction...")
+                time.sleep(1)
+    except KeyboardInterrupt:
+        print("\nBrowser will be closed...")
     finally:
         print("Closing browser...")
         driver.quit()
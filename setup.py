@@ -7,21 +7,43 @@ import os
 def install_requirements():
     """Install required packages"""
     print("Installing requirements...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check",
+        "-r", "requirements.txt"
+    ])
+
+def _chromedriver_smoke_test():
+    """Start and tear down a headless Chrome to prove the driver works"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    driver = webdriver.Chrome(options=options)
+    driver.quit()
+    print("ChromeDriver is working correctly.")
 
 def check_chromedriver():
-    """Check if ChromeDriver is available"""
+    """Resolve ChromeDriver via Selenium Manager without launching Chrome"""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        
-        driver = webdriver.Chrome(options=options)
-        driver.quit()
-        print("ChromeDriver is working correctly!")
+        # Selenium Manager ships with selenium 4.6+ and downloads/locates a
+        # matching driver; resolving the path here skips the old smoke test
+        # that started and tore down a whole headless browser. binary_paths
+        # only appeared around selenium 4.20, and requirements.txt allows
+        # 4.15+, so fall back to the smoke test when it's missing
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+        manager = SeleniumManager()
+        if hasattr(manager, "binary_paths"):
+            paths = manager.binary_paths(["--browser", "chrome"])
+            driver_path = paths.get("driver_path") or ""
+            if driver_path:
+                print("ChromeDriver resolved: " + driver_path)
+            else:
+                print("ChromeDriver will be resolved on first use.")
+        else:
+            _chromedriver_smoke_test()
         return True
     except Exception as e:
         print("ChromeDriver issue: " + str(e))